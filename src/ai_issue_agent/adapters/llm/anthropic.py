@@ -26,7 +26,12 @@ from ...models.analysis import CodeContext, ErrorAnalysis, SuggestedFix
 from ...models.issue import Issue
 from ...models.traceback import ParsedTraceback
 from ...utils.async_helpers import LLMAnalysisError, RateLimitError, TimeoutError
-from ...utils.security import RedactionError, SecretRedactor, SecurityError
+from ...utils.security import (
+    RedactionError,
+    SecretRedactor,
+    SecurityError,
+    get_default_redactor,
+)
 
 if TYPE_CHECKING:
     pass
@@ -101,10 +106,10 @@ class AnthropicAdapter:
 
         Args:
             config: Anthropic-specific configuration.
-            redactor: Secret redactor. If None, creates default.
+            redactor: Secret redactor. If None, uses the shared default.
         """
         self._config = config
-        self._redactor = redactor or SecretRedactor()
+        self._redactor = redactor or get_default_redactor()
         self._client = anthropic.AsyncAnthropic(api_key=config.api_key)
 
     @property
@@ -33,7 +33,12 @@ from ...utils.safe_subprocess import (
     RateLimitError,
     SafeGHCli,
 )
-from ...utils.security import SecretRedactor, SecurityError, validate_repo_name
+from ...utils.security import (
+    SecretRedactor,
+    SecurityError,
+    get_default_redactor,
+    validate_repo_name,
+)
 
 if TYPE_CHECKING:
     from typing import Any
@@ -86,10 +91,10 @@ class GitHubAdapter:
 
         Args:
             config: GitHub-specific configuration.
-            redactor: Secret redactor for issue bodies. If None, creates default.
+            redactor: Secret redactor for issue bodies. If None, uses the shared default.
         """
         self._config = config
-        self._redactor = redactor or SecretRedactor()
+        self._redactor = redactor or get_default_redactor()
         self._gh = SafeGHCli(gh_path=config.gh_path)
 
         # Clone cache: maps repo -> (path, timestamp)
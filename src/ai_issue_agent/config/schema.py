@@ -120,6 +120,7 @@ class MatchingConfig(BaseModel):
     max_search_results: int = Field(20, ge=1, le=100)
     include_closed: bool = True
     search_cache_ttl: int = Field(300, ge=0)
+    multilingual_stopwords: list[str] = []
 
 
 class AnalysisConfig(BaseModel):
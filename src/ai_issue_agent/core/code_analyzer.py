@@ -22,7 +22,7 @@ import structlog
 from ai_issue_agent.config.schema import AnalysisConfig, GitHubConfig
 from ai_issue_agent.models.analysis import CodeContext
 from ai_issue_agent.models.traceback import ParsedTraceback
-from ai_issue_agent.utils.security import SecretRedactor
+from ai_issue_agent.utils.security import get_default_redactor
 
 if TYPE_CHECKING:
     from ai_issue_agent.interfaces.vcs import VCSProvider
@@ -158,7 +158,7 @@ class CodeAnalyzer:
 
         # Initialize cache and redactor
         self._cache = RepoCache(ttl=cache_ttl)
-        self._redactor = SecretRedactor()
+        self._redactor = get_default_redactor()
 
     async def analyze(
         self,
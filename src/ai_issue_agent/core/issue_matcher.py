@@ -11,7 +11,9 @@ See docs/ARCHITECTURE.md for the canonical design.
 
 from __future__ import annotations
 
+from collections.abc import Container
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import structlog
@@ -26,6 +28,160 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# Common English words skipped when extracting key terms
+_STOP_WORDS: frozenset[str] = frozenset(
+    [
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "need",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "as",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "between",
+        "under",
+        "over",
+        "again",
+        "further",
+        "then",
+        "once",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "just",
+        "but",
+        "and",
+        "or",
+        "if",
+        "because",
+        "until",
+        "while",
+        "got",
+        "invalid",
+        "error",
+        "failed",
+        "cannot",
+    ]
+)
+
+
+@lru_cache(maxsize=8)
+def _load_multilingual_stop_words(languages: tuple[str, ...]) -> Container[str]:
+    """Build a stop-word trie covering the given languages.
+
+    Multi-language stop-word lists run to thousands of entries, so they are
+    stored in a compact marisa-trie rather than a set. Requires the optional
+    ``multilingual`` extra (``marisa-trie`` and ``stop-words``). Falls back to
+    the English stop words if the extra is not installed, and skips (with a
+    warning) any language that stop-words does not know.
+
+    Args:
+        languages: Language names or ISO codes (e.g., ("en", "de"))
+
+    Returns:
+        Container supporting ``in`` lookups for stop words
+    """
+    try:
+        import marisa_trie
+        from stop_words import StopWordError, get_stop_words
+    except ImportError:
+        log.warning(
+            "multilingual_stopwords_unavailable",
+            languages=list(languages),
+            fallback="english_stop_words",
+        )
+        return _STOP_WORDS
+
+    words = set(_STOP_WORDS)
+    for language in languages:
+        try:
+            language_words = get_stop_words(language)
+        except StopWordError:
+            log.warning(
+                "multilingual_stopwords_unknown_language",
+                language=language,
+                fallback="english_stop_words",
+            )
+            continue
+        words.update(word.lower() for word in language_words)
+
+    return marisa_trie.Trie(words)  # type: ignore[no-any-return]
+
+
+@lru_cache(maxsize=512)
+def _issue_text(number: int, title: str, body: str) -> str:
+    """Return the lowercased title and body text of an issue.
+
+    Each scoring strategy searches the same issue text, so it is built
+    once per issue rather than once per strategy.
+
+    Args:
+        number: Issue number (keeps entries for different issues distinct)
+        title: Issue title
+        body: Issue body
+
+    Returns:
+        Lowercased "title body" text
+    """
+    return " ".join((title, body)).lower()
+
 
 class IssueMatcherError(Exception):
     """Base exception for issue matching errors."""
@@ -95,6 +251,10 @@ class IssueMatcher:
             "semantic": MatchStrategy("semantic", self.DEFAULT_SEMANTIC_WEIGHT),
         }
 
+        self._stop_words: Container[str] = _STOP_WORDS
+        if config.multilingual_stopwords:
+            self._stop_words = _load_multilingual_stop_words(tuple(config.multilingual_stopwords))
+
     @property
     def confidence_threshold(self) -> float:
         """Return the confidence threshold for matches."""
@@ -216,105 +376,12 @@ class IssueMatcher:
         Returns:
             List of significant terms
         """
-        # Common words to skip
-        stop_words = frozenset(
-            [
-                "the",
-                "a",
-                "an",
-                "is",
-                "are",
-                "was",
-                "were",
-                "be",
-                "been",
-                "being",
-                "have",
-                "has",
-                "had",
-                "do",
-                "does",
-                "did",
-                "will",
-                "would",
-                "could",
-                "should",
-                "may",
-                "might",
-                "must",
-                "shall",
-                "can",
-                "need",
-                "to",
-                "of",
-                "in",
-                "for",
-                "on",
-                "with",
-                "at",
-                "by",
-                "from",
-                "as",
-                "into",
-                "through",
-                "during",
-                "before",
-                "after",
-                "above",
-                "below",
-                "between",
-                "under",
-                "over",
-                "again",
-                "further",
-                "then",
-                "once",
-                "here",
-                "there",
-                "when",
-                "where",
-                "why",
-                "how",
-                "all",
-                "each",
-                "few",
-                "more",
-                "most",
-                "other",
-                "some",
-                "such",
-                "no",
-                "nor",
-                "not",
-                "only",
-                "own",
-                "same",
-                "so",
-                "than",
-                "too",
-                "very",
-                "just",
-                "but",
-                "and",
-                "or",
-                "if",
-                "because",
-                "until",
-                "while",
-                "got",
-                "invalid",
-                "error",
-                "failed",
-                "cannot",
-            ]
-        )
-
         # Split and filter
         words = message.lower().replace("'", " ").replace('"', " ").split()
         terms = [
             word.strip(".,;:!?()[]{}'\"-")
             for word in words
-            if len(word) > 2 and word.lower() not in stop_words
+            if len(word) > 2 and word.lower() not in self._stop_words
         ]
 
         return terms
@@ -395,7 +462,7 @@ class IssueMatcher:
             Score from 0.0 to 1.0
         """
         score = 0.0
-        issue_text = f"{issue.title} {issue.body}".lower()
+        issue_text = _issue_text(issue.number, issue.title, issue.body)
         exception_type_lower = traceback.exception_type.lower()
 
         # Check for exception type in issue
@@ -431,7 +498,7 @@ class IssueMatcher:
             return 0.0
 
         score = 0.0
-        issue_text = f"{issue.title} {issue.body}".lower()
+        issue_text = _issue_text(issue.number, issue.title, issue.body)
 
         # Check for file names
         file_matches = 0
@@ -53,7 +53,7 @@ class MessageHandler:
     1. Add 👀 reaction (acknowledge receipt)
     2. Check for traceback (TracebackParser.contains_traceback())
     3. If no traceback: remove reaction, return NO_TRACEBACK
-    4. Parse traceback
+    4. Parse traceback (on failure: mark with error reaction, return ERROR)
     5. Identify repository (from config/channel mapping)
     6. Search existing issues (IssueMatcher.find_matches())
     7. If high-confidence match: reply with link, return EXISTING_ISSUE_LINKED
@@ -150,8 +150,13 @@ class MessageHandler:
                 traceback = self._parser.parse(message.text)
             except Exception as e:
                 log.warning("traceback_parse_failed", message_id=message_id, error=str(e))
-                await self._remove_reaction(channel_id, message_id, self._processing_reaction)
-                return ProcessingResult.NO_TRACEBACK
+                await self._update_reaction(
+                    channel_id,
+                    message_id,
+                    self._processing_reaction,
+                    self._error_reaction,
+                )
+                return ProcessingResult.ERROR
 
             log.info(
                 "traceback_parsed",
@@ -1,19 +1,27 @@
 """Parser for Python tracebacks.
 
 This module implements the TracebackParser class that detects and parses
-Python tracebacks from text. It supports:
+Python tracebacks from text. The parser holds no state, so its work is done by
+module-level functions that the class exposes as static methods. It supports:
 - Standard tracebacks
 - Chained exceptions (raise ... from ...)
 - SyntaxError tracebacks
 - Tracebacks in code blocks (```)
 - Multi-line exception messages
 
+Input is always str: chat adapters deliver decoded message text, so there is
+no bytes path to keep in step with the str one.
+
 See docs/ARCHITECTURE.md for the canonical design.
 """
 
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import chain, pairwise
 
 import structlog
 
@@ -22,358 +30,486 @@ from ai_issue_agent.utils.async_helpers import TracebackParseError
 
 log = structlog.get_logger()
 
+# Literals that every traceback (or SyntaxError report) contains; text with
+# neither can be rejected without running any regex
+_HEADER_TEXT = "Traceback (most recent call last):"
+_FRAME_TEXT = 'File "'
+
+# Lines Python prints between the tracebacks of an exception chain
+_CHAIN_MARKERS = (
+    "The above exception was the direct cause of the following exception:",
+    "During handling of the above exception, another exception occurred:",
+)
+
+# Regex patterns for traceback parsing. _FRAME_PATTERN is the reference
+# grammar for frame lines; _split_frame_line implements it without regex.
+_TRACEBACK_HEADER = re.compile(r"Traceback \(most recent call last\):")
+_FRAME_PATTERN = re.compile(
+    r'^\s*File "([^"]+)", line (\d+)(?:, in (.+))?$',
+    re.MULTILINE,
+)
+# Frame lines in the shape CPython prints them, with a lookahead capturing the
+# following line (not consumed, so consecutive frame lines all match).
+# _LINE_BREAKS lists every boundary str.splitlines() recognizes.
+_LINE_BREAKS = r"\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029"
+_STANDARD_FRAME_PATTERN = re.compile(
+    rf'^  File "([^"{_LINE_BREAKS}]+)", line (\d+), in ([^{_LINE_BREAKS}]+)\n'
+    rf"(?=([^{_LINE_BREAKS}]*))",
+    re.MULTILINE,
+)
+_EXCEPTION_PATTERN = re.compile(
+    r"^([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*):\s*(.*)$",
+    re.MULTILINE,
+)
+_EXCEPTION_NO_MSG_PATTERN = re.compile(
+    r"^([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)$",
+    re.MULTILINE,
+)
+_CHAINED_PATTERN = re.compile(
+    r"^(?:The above exception was the direct cause of the following exception:|"
+    r"During handling of the above exception, another exception occurred:)$",
+    re.MULTILINE,
+)
+_SYNTAX_ERROR_PATTERN = re.compile(
+    r"^\s*File \"([^\"]+)\", line (\d+).*\n"
+    r"(?:.*\n)?"
+    r"\s*\^+\n"
+    r"(SyntaxError|IndentationError|TabError):\s*(.*)",
+    re.MULTILINE,
+)
+_CODE_BLOCK_PATTERN = re.compile(r"```(?:python|py)?\n(.*?)```", re.DOTALL)
+
+# Exception names _SYNTAX_ERROR_PATTERN requires; text without any of them
+# cannot match, which spares the costly multi-line search on most tracebacks
+_SYNTAX_ERROR_NAMES = ("SyntaxError", "IndentationError", "TabError")
+
+
+def _split_frame_line(line: str) -> tuple[str, int, str] | None:
+    """Split a frame line into (file path, line number, function name).
+
+    Implements _FRAME_PATTERN with str methods, which is cheaper than a regex
+    match on the many lines that are not frames. The path and function name
+    are interned, since tracebacks repeat them across frames.
+
+    Returns:
+        The frame fields, or None if the line is not a frame line
+    """
+    stripped = line.lstrip()
+    if not stripped.startswith(_FRAME_TEXT):
+        return None
+    file_path, sep, rest = stripped[len(_FRAME_TEXT) :].partition('", line ')
+    if not sep or not file_path or '"' in file_path:
+        return None
+    number, sep, function_name = rest.partition(", in ")
+    # isdecimal() accepts exactly what the regex's \d does
+    if not number.isdecimal() or (sep and not function_name):
+        return None
+    return sys.intern(file_path), int(number), sys.intern(function_name or "<module>")
 
-class TracebackParser:
-    """Parser for Python tracebacks.
 
-    Responsibilities:
-    - Detect if text contains a Python traceback
-    - Extract exception type, message, and stack frames
-    - Handle various traceback formats (standard, chained, syntax errors)
-    - Normalize file paths for matching
+def _search_syntax_error(text: str) -> re.Match[str] | None:
+    """Search text for a SyntaxError report, skipping the regex when it cannot match."""
+    if not any(name in text for name in _SYNTAX_ERROR_NAMES):
+        return None
+    return _SYNTAX_ERROR_PATTERN.search(text)
 
-    Example:
-        parser = TracebackParser()
-        if parser.contains_traceback(text):
-            traceback = parser.parse(text)
-            print(f"Exception: {traceback.exception_type}")
+
+# Only texts up to this length are memoized, so the caches never pin large
+# messages; longer texts are scanned every time
+_CACHED_TEXT_LIMIT = 4096
+
+
+@lru_cache(maxsize=1024)
+def _contains_traceback_cached(text: str) -> bool:
+    """Memoized _scan_for_traceback for short texts."""
+    return _scan_for_traceback(text)
+
+
+def _scan_for_traceback(text: str) -> bool:
+    """Scan text for a traceback header or SyntaxError report."""
+    if not text:
+        return False
+
+    # Check for standard traceback header
+    if _HEADER_TEXT in text:
+        return True
+
+    # Check for syntax errors. Code blocks need no separate scan: a block
+    # starts at a line start, so any match inside one also matches here.
+    return _FRAME_TEXT in text and _search_syntax_error(text) is not None
+
+
+def contains_traceback(text: str) -> bool:
+    """Check if text contains a Python traceback.
+
+    Messages are often checked again when they are re-processed, so results
+    for texts up to _CACHED_TEXT_LIMIT characters are memoized.
+
+    Args:
+        text: Text to check for tracebacks
+
+    Returns:
+        True if a traceback is detected, False otherwise
     """
+    if len(text) <= _CACHED_TEXT_LIMIT:
+        return _contains_traceback_cached(text)
+    return _scan_for_traceback(text)
 
-    # Regex patterns for traceback parsing
-    TRACEBACK_HEADER = re.compile(r"Traceback \(most recent call last\):")
-    FRAME_PATTERN = re.compile(
-        r'^\s*File "([^"]+)", line (\d+)(?:, in (.+))?$',
-        re.MULTILINE,
-    )
-    EXCEPTION_PATTERN = re.compile(
-        r"^([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*):\s*(.*)$",
-        re.MULTILINE,
-    )
-    EXCEPTION_NO_MSG_PATTERN = re.compile(
-        r"^([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)$",
-        re.MULTILINE,
-    )
-    CHAINED_PATTERN = re.compile(
-        r"^(?:The above exception was the direct cause of the following exception:|"
-        r"During handling of the above exception, another exception occurred:)$",
-        re.MULTILINE,
-    )
-    SYNTAX_ERROR_PATTERN = re.compile(
-        r"^\s*File \"([^\"]+)\", line (\d+).*\n"
-        r"(?:.*\n)?"
-        r"\s*\^+\n"
-        r"(SyntaxError|IndentationError|TabError):\s*(.*)",
-        re.MULTILINE,
-    )
-    CODE_BLOCK_PATTERN = re.compile(r"```(?:python|py)?\n(.*?)```", re.DOTALL)
 
-    def __init__(self) -> None:
-        """Initialize the TracebackParser."""
-        pass
+def parse_traceback(text: str) -> ParsedTraceback:
+    """Parse a Python traceback from text.
 
-    def contains_traceback(self, text: str) -> bool:
-        """Check if text contains a Python traceback.
+    Results for texts up to _CACHED_TEXT_LIMIT characters are memoized, so
+    parsing the same text again returns the same immutable ParsedTraceback.
 
-        Args:
-            text: Text to check for tracebacks
+    Args:
+        text: Text containing a Python traceback
 
-        Returns:
-            True if a traceback is detected, False otherwise
-        """
-        if not text:
-            return False
+    Returns:
+        ParsedTraceback with extracted information
 
-        # Check for standard traceback header
-        if self.TRACEBACK_HEADER.search(text):
-            return True
+    Raises:
+        TracebackParseError: If no valid traceback is found
+    """
+    if len(text) <= _CACHED_TEXT_LIMIT:
+        return _parse_traceback_cached(text)
+    return _parse_traceback(text)
 
-        # Check for syntax errors
-        if self.SYNTAX_ERROR_PATTERN.search(text):
-            return True
 
-        # Check in code blocks
-        for match in self.CODE_BLOCK_PATTERN.finditer(text):
-            block_content = match.group(1)
-            if self.TRACEBACK_HEADER.search(block_content):
-                return True
-            if self.SYNTAX_ERROR_PATTERN.search(block_content):
-                return True
+@lru_cache(maxsize=256)
+def _parse_traceback_cached(text: str) -> ParsedTraceback:
+    """Memoized _parse_traceback for short texts; failures are not cached."""
+    return _parse_traceback(text)
 
-        return False
 
-    def parse(self, text: str) -> ParsedTraceback:
-        """Parse a Python traceback from text.
+def _parse_traceback(text: str) -> ParsedTraceback:
+    """Parse a Python traceback from text (uncached; see parse_traceback)."""
+    if not text:
+        raise TracebackParseError("Empty text provided")
+    if _HEADER_TEXT not in text and _FRAME_TEXT not in text:
+        raise TracebackParseError("No traceback header found")
 
-        Args:
-            text: Text containing a Python traceback
+    # Try to extract from code blocks first
+    extracted_text = _extract_from_code_blocks(text) or text
 
-        Returns:
-            ParsedTraceback with extracted information
+    # Check for syntax errors first (special format)
+    syntax_match = _search_syntax_error(extracted_text)
+    if syntax_match:
+        return _parse_syntax_error(syntax_match, text)
 
-        Raises:
-            TracebackParseError: If no valid traceback is found
-        """
-        if not text:
-            raise TracebackParseError("Empty text provided")
+    # Find traceback header
+    traceback_start = extracted_text.find(_HEADER_TEXT)
+    if traceback_start == -1:
+        raise TracebackParseError("No traceback header found")
 
-        # Try to extract from code blocks first
-        extracted_text = self._extract_from_code_blocks(text) or text
+    # Extract the traceback portion
+    traceback_text = extracted_text[traceback_start:]
 
-        # Check for syntax errors first (special format)
-        syntax_match = self.SYNTAX_ERROR_PATTERN.search(extracted_text)
-        if syntax_match:
-            return self._parse_syntax_error(syntax_match, text)
+    # Check for chained exceptions. The literal test skips the regex for the
+    # common unchained case; _parse_chained splits on the markers in one pass
+    # and falls back to a single parse if none sits on its own line.
+    if any(marker in traceback_text for marker in _CHAIN_MARKERS):
+        return _parse_chained(traceback_text, text)
 
-        # Find traceback header
-        header_match = self.TRACEBACK_HEADER.search(extracted_text)
-        if not header_match:
-            raise TracebackParseError("No traceback header found")
+    # Parse single traceback
+    return _parse_single(traceback_text, text)
 
-        # Extract the traceback portion
-        traceback_start = header_match.start()
-        traceback_text = extracted_text[traceback_start:]
 
-        # Check for chained exceptions
-        chain_match = self.CHAINED_PATTERN.search(traceback_text)
-        if chain_match:
-            return self._parse_chained(traceback_text, text)
+def extract_tracebacks(text: str) -> list[ParsedTraceback]:
+    """Extract all tracebacks from text (for chained exceptions).
 
-        # Parse single traceback
-        return self._parse_single(traceback_text, text)
+    Args:
+        text: Text potentially containing multiple tracebacks
 
-    def extract_all(self, text: str) -> list[ParsedTraceback]:
-        """Extract all tracebacks from text (for chained exceptions).
+    Returns:
+        List of ParsedTraceback objects in the order they appear in the text
+        (for a chain, causes before the exceptions they caused)
+    """
+    return list(iter_tracebacks(text))
 
-        Args:
-            text: Text potentially containing multiple tracebacks
 
-        Returns:
-            List of ParsedTraceback objects, ordered from outermost to innermost
-        """
-        tracebacks: list[ParsedTraceback] = []
+def iter_tracebacks(text: str) -> Iterator[ParsedTraceback]:
+    """Yield the tracebacks in text one at a time, in order.
 
-        # Extract from code blocks
-        extracted_text = self._extract_from_code_blocks(text) or text
+    Each traceback is parsed only when it is requested, so callers that stop
+    early (e.g. with itertools.islice) skip the rest of the text.
 
-        # Split by chain markers
-        chain_splits = self.CHAINED_PATTERN.split(extracted_text)
+    Args:
+        text: Text potentially containing multiple tracebacks
 
-        for segment in chain_splits:
-            if self.TRACEBACK_HEADER.search(segment):
-                try:
-                    tb = self._parse_single(segment, segment)
-                    tracebacks.append(tb)
-                except TracebackParseError:
-                    continue
+    Yields:
+        ParsedTraceback objects in the order they appear in the text
+    """
+    # Extract from code blocks
+    extracted_text = _extract_from_code_blocks(text) or text
+    if _HEADER_TEXT not in extracted_text:
+        return
+
+    # Each traceback runs from its header to the next header (or the end)
+    starts = chain(
+        (m.start() for m in _TRACEBACK_HEADER.finditer(extracted_text)),
+        (len(extracted_text),),
+    )
+
+    # Segments are parsed serially: parsing is pure Python and holds the GIL,
+    # so a thread pool only adds dispatch overhead
+    for start, end in pairwise(starts):
+        segment = extracted_text[start:end].rstrip()
+        for marker in _CHAIN_MARKERS:
+            if segment.endswith(marker):
+                segment = segment[: -len(marker)].rstrip()
+                break
+        try:
+            yield _parse_single(segment, segment)
+        except TracebackParseError:
+            continue
 
-        return tracebacks
 
-    def _extract_from_code_blocks(self, text: str) -> str | None:
-        """Extract traceback from code blocks if present.
+def _extract_from_code_blocks(text: str) -> str | None:
+    """Extract traceback from code blocks if present.
 
-        Args:
-            text: Text potentially containing code blocks
+    Args:
+        text: Text potentially containing code blocks
 
-        Returns:
-            Content of first code block with traceback, or None
-        """
-        for match in self.CODE_BLOCK_PATTERN.finditer(text):
-            block_content = match.group(1)
-            if self.TRACEBACK_HEADER.search(block_content) or self.SYNTAX_ERROR_PATTERN.search(
-                block_content
-            ):
-                return block_content
+    Returns:
+        Content of first code block with traceback, or None
+    """
+    if "```" not in text:
         return None
+    for match in _CODE_BLOCK_PATTERN.finditer(text):
+        block_content = match.group(1)
+        if _HEADER_TEXT in block_content or _search_syntax_error(block_content):
+            return block_content
+    return None
+
+
+def _parse_single(traceback_text: str, raw_text: str) -> ParsedTraceback:
+    """Parse a single (non-chained) traceback.
 
-    def _parse_single(self, traceback_text: str, raw_text: str) -> ParsedTraceback:
-        """Parse a single (non-chained) traceback.
+    Args:
+        traceback_text: Text containing just the traceback
+        raw_text: Original raw text
 
-        Args:
-            traceback_text: Text containing just the traceback
-            raw_text: Original raw text
+    Returns:
+        ParsedTraceback
+
+    Raises:
+        TracebackParseError: If parsing fails
+    """
+    # Extract frames
+    frames = _extract_frames(traceback_text)
+
+    # Extract exception info
+    exception_type, exception_message = _extract_exception(traceback_text)
+
+    if not exception_type:
+        raise TracebackParseError("Could not extract exception type")
+
+    return ParsedTraceback(
+        exception_type=exception_type,
+        exception_message=exception_message,
+        frames=frames,
+        raw_text=raw_text,
+        is_chained=False,
+        cause=None,
+    )
 
-        Returns:
-            ParsedTraceback
 
-        Raises:
-            TracebackParseError: If parsing fails
-        """
-        # Extract frames
-        frames = self._extract_frames(traceback_text)
+def _parse_chained(traceback_text: str, raw_text: str) -> ParsedTraceback:
+    """Parse a chained exception traceback.
 
-        # Extract exception info
-        exception_type, exception_message = self._extract_exception(traceback_text)
+    Args:
+        traceback_text: Text containing chained tracebacks
+        raw_text: Original raw text
+
+    Returns:
+        ParsedTraceback with cause chain (outermost exception with cause pointing to inner)
+    """
+    # Split by chain markers
+    segments = [
+        stripped
+        for segment in _CHAINED_PATTERN.split(traceback_text)
+        if (stripped := segment.strip())
+    ]
+
+    if len(segments) < 2:
+        # Fall back to single parse
+        return _parse_single(traceback_text, raw_text)
+
+    # Parse from first to last (cause to effect)
+    # In a chained traceback:
+    #   - First segment is the original/cause exception
+    #   - Last segment is the final/outer exception
+    # We build the chain so each later exception has the earlier as its cause
+    cause_tb: ParsedTraceback | None = None
+
+    for segment in segments:
+        if _HEADER_TEXT not in segment:
+            continue
+
+        frames = _extract_frames(segment)
+        exception_type, exception_message = _extract_exception(segment)
 
         if not exception_type:
-            raise TracebackParseError("Could not extract exception type")
+            continue
 
-        return ParsedTraceback(
+        cause_tb = ParsedTraceback(
             exception_type=exception_type,
             exception_message=exception_message,
-            frames=tuple(frames),
-            raw_text=raw_text,
-            is_chained=False,
-            cause=None,
+            frames=frames,
+            raw_text=segment,
+            is_chained=cause_tb is not None,
+            cause=cause_tb,
         )
 
-    def _parse_chained(self, traceback_text: str, raw_text: str) -> ParsedTraceback:
-        """Parse a chained exception traceback.
-
-        Args:
-            traceback_text: Text containing chained tracebacks
-            raw_text: Original raw text
-
-        Returns:
-            ParsedTraceback with cause chain (outermost exception with cause pointing to inner)
-        """
-        # Split by chain markers
-        segments = self.CHAINED_PATTERN.split(traceback_text)
-        segments = [s.strip() for s in segments if s.strip()]
-
-        if len(segments) < 2:
-            # Fall back to single parse
-            return self._parse_single(traceback_text, raw_text)
-
-        # Parse from first to last (cause to effect)
-        # In a chained traceback:
-        #   - First segment is the original/cause exception
-        #   - Last segment is the final/outer exception
-        # We build the chain so each later exception has the earlier as its cause
-        cause_tb: ParsedTraceback | None = None
-
-        for segment in segments:
-            if not self.TRACEBACK_HEADER.search(segment):
-                continue
-
-            frames = self._extract_frames(segment)
-            exception_type, exception_message = self._extract_exception(segment)
-
-            if not exception_type:
-                continue
-
-            cause_tb = ParsedTraceback(
-                exception_type=exception_type,
-                exception_message=exception_message,
-                frames=tuple(frames),
-                raw_text=segment,
-                is_chained=cause_tb is not None,
-                cause=cause_tb,
-            )
-
-        if cause_tb is None:
-            raise TracebackParseError("Could not parse any exceptions from chain")
-
-        return cause_tb
-
-    def _parse_syntax_error(
-        self,
-        match: re.Match[str],
-        raw_text: str,
-    ) -> ParsedTraceback:
-        """Parse a syntax error traceback.
-
-        Args:
-            match: Regex match for syntax error pattern
-            raw_text: Original raw text
-
-        Returns:
-            ParsedTraceback for syntax error
-        """
-        file_path = match.group(1)
-        line_number = int(match.group(2))
-        exception_type = match.group(3)
-        exception_message = match.group(4)
-
-        # Create a single frame for the syntax error location
-        frame = StackFrame(
-            file_path=file_path,
-            line_number=line_number,
-            function_name="<module>",
-            code_line=None,
-        )
+    if cause_tb is None:
+        raise TracebackParseError("Could not parse any exceptions from chain")
 
-        return ParsedTraceback(
-            exception_type=exception_type,
-            exception_message=exception_message,
-            frames=(frame,),
-            raw_text=raw_text,
-            is_chained=False,
-            cause=None,
-        )
+    return cause_tb
+
+
+def _parse_syntax_error(match: re.Match[str], raw_text: str) -> ParsedTraceback:
+    """Parse a syntax error traceback.
+
+    Args:
+        match: Regex match for syntax error pattern
+        raw_text: Original raw text
 
-    def _extract_frames(self, traceback_text: str) -> list[StackFrame]:
-        """Extract stack frames from traceback text.
-
-        Args:
-            traceback_text: Traceback text to parse
-
-        Returns:
-            List of StackFrame objects
-        """
-        frames: list[StackFrame] = []
-        lines = traceback_text.splitlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            frame_match = self.FRAME_PATTERN.match(line)
-
-            if frame_match:
-                file_path = frame_match.group(1)
-                line_number = int(frame_match.group(2))
-                function_name = frame_match.group(3) or "<module>"
-
-                # Try to get the code line (next line, indented)
-                code_line = None
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1]
-                    # Check if it's a code line (indented but not a File line)
-                    if next_line.startswith("    ") and not next_line.strip().startswith("File"):
-                        code_line = next_line.strip()
-                        i += 1
-
-                frames.append(
-                    StackFrame(
-                        file_path=file_path,
-                        line_number=line_number,
-                        function_name=function_name,
-                        code_line=code_line,
-                    )
+    Returns:
+        ParsedTraceback for syntax error
+    """
+    file_path = sys.intern(match.group(1))
+    line_number = int(match.group(2))
+    exception_type = sys.intern(match.group(3))
+    exception_message = match.group(4)
+
+    # Create a single frame for the syntax error location
+    frame = StackFrame(
+        file_path=file_path,
+        line_number=line_number,
+        function_name="<module>",
+        code_line=None,
+    )
+
+    return ParsedTraceback(
+        exception_type=exception_type,
+        exception_message=exception_message,
+        frames=(frame,),
+        raw_text=raw_text,
+        is_chained=False,
+        cause=None,
+    )
+
+
+def _extract_frames(traceback_text: str) -> tuple[StackFrame, ...]:
+    """Extract stack frames from traceback text.
+
+    Args:
+        traceback_text: Traceback text to parse
+
+    Returns:
+        Tuple of StackFrame objects
+    """
+    # Fast path: one findall covers the standard layout. It is exact when every
+    # 'File "' in the text belongs to a matched frame line; anything else
+    # (other indentation, no function name, CRLF endings) takes the general path.
+    matches = _STANDARD_FRAME_PATTERN.findall(traceback_text)
+    if len(matches) == traceback_text.count(_FRAME_TEXT):
+        return tuple(
+            [
+                StackFrame(
+                    sys.intern(file_path),
+                    int(line_number),
+                    sys.intern(function_name),
+                    _code_line(next_line),
                 )
+                for file_path, line_number, function_name, next_line in matches
+            ]
+        )
 
-            i += 1
+    # Pair each line with the next (or "" for the last), which holds the
+    # frame's source line when it is indented and not another frame. A list
+    # pre-sized from a count of frame lines measured no faster than the
+    # comprehension, which avoids the separate counting pass.
+    return tuple(
+        [
+            StackFrame(*frame_fields, code_line=_code_line(next_line))
+            for line, next_line in pairwise([*traceback_text.splitlines(), ""])
+            if (frame_fields := _split_frame_line(line))
+        ]
+    )
 
-        return frames
 
-    def _extract_exception(self, traceback_text: str) -> tuple[str, str]:
-        """Extract exception type and message from traceback.
+def _code_line(line: str) -> str | None:
+    """Return the source line shown under a frame, or None if line is not one."""
+    if line.startswith("    ") and not line.strip().startswith("File"):
+        return line.strip()
+    return None
 
-        Args:
-            traceback_text: Traceback text to parse
 
-        Returns:
-            Tuple of (exception_type, exception_message)
-        """
-        lines = traceback_text.splitlines()
+def _extract_exception(traceback_text: str) -> tuple[str, str]:
+    """Extract exception type and message from traceback.
 
-        # Search from the end for the exception line
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
-                continue
+    Args:
+        traceback_text: Traceback text to parse
 
-            # Skip frame lines and other non-exception lines
-            if line.startswith("File ") or line.startswith("^"):
-                continue
+    Returns:
+        Tuple of (exception_type, exception_message); the type is interned
+    """
+    lines = traceback_text.splitlines()
+
+    # Search from the end for the exception line
+    for line in reversed(lines):
+        line = line.strip()
+        if not line:
+            continue
+
+        # Skip frame lines and other non-exception lines
+        if line.startswith("File ") or line.startswith("^"):
+            continue
+
+        # Try to match exception with message
+        exc_match = _EXCEPTION_PATTERN.match(line)
+        if exc_match:
+            return (sys.intern(exc_match.group(1)), exc_match.group(2))
+
+        # Try to match exception without message
+        exc_no_msg_match = _EXCEPTION_NO_MSG_PATTERN.match(line)
+        if exc_no_msg_match:
+            return (sys.intern(exc_no_msg_match.group(1)), "")
+
+    return ("", "")
+
+
+class TracebackParser:
+    """Parser for Python tracebacks.
+
+    Responsibilities:
+    - Detect if text contains a Python traceback
+    - Extract exception type, message, and stack frames
+    - Handle various traceback formats (standard, chained, syntax errors)
+    - Normalize file paths for matching
 
-            # Try to match exception with message
-            exc_match = self.EXCEPTION_PATTERN.match(line)
-            if exc_match:
-                return (exc_match.group(1), exc_match.group(2))
+    The parser is stateless: its methods are static and delegate to the
+    module-level functions, which callers may also use directly.
 
-            # Try to match exception without message
-            exc_no_msg_match = self.EXCEPTION_NO_MSG_PATTERN.match(line)
-            if exc_no_msg_match:
-                return (exc_no_msg_match.group(1), "")
+    Example:
+        parser = TracebackParser()
+        if parser.contains_traceback(text):
+            traceback = parser.parse(text)
+            print(f"Exception: {traceback.exception_type}")
+    """
 
-        return ("", "")
+    # Compiled patterns, kept as class attributes for existing callers
+    TRACEBACK_HEADER = _TRACEBACK_HEADER
+    FRAME_PATTERN = _FRAME_PATTERN
+    EXCEPTION_PATTERN = _EXCEPTION_PATTERN
+    EXCEPTION_NO_MSG_PATTERN = _EXCEPTION_NO_MSG_PATTERN
+    CHAINED_PATTERN = _CHAINED_PATTERN
+    SYNTAX_ERROR_PATTERN = _SYNTAX_ERROR_PATTERN
+    CODE_BLOCK_PATTERN = _CODE_BLOCK_PATTERN
+
+    contains_traceback = staticmethod(contains_traceback)
+    parse = staticmethod(parse_traceback)
+    extract_all = staticmethod(extract_tracebacks)
+    iter_tracebacks = staticmethod(iter_tracebacks)
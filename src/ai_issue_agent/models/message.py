@@ -18,7 +18,8 @@ class ChatMessage:
     text: str
     timestamp: datetime
 
-    # Platform-specific metadata
+    # Platform-specific metadata. Stored by reference, not copied: adapters
+    # hand over a fresh payload per event and nothing mutates it afterwards.
     raw_event: dict[str, Any]  # Original event payload
 
 
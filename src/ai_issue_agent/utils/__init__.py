@@ -37,6 +37,7 @@ from ai_issue_agent.utils.security import (
     SecretRedactor,
     SecurityError,
     ValidationError,
+    get_default_redactor,
 )
 
 __all__ = [
@@ -62,6 +63,7 @@ __all__ = [
     "bind_context",
     "clear_context",
     "configure_logging",
+    "get_default_redactor",
     "get_logger",
     "get_metrics",
     "unbind_context",
@@ -13,17 +13,19 @@ from __future__ import annotations
 
 import logging
 import sys
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 import structlog
 from structlog.typing import WrappedLogger
 
-# Re-use the SecretRedactor for log sanitization
-from ai_issue_agent.utils.security import SecretRedactor
+# Re-use the shared SecretRedactor for log sanitization
+from ai_issue_agent.utils.security import get_default_redactor
 
 
 class LogFormat(StrEnum):
@@ -62,16 +64,12 @@ class LogConfig:
     file: FileLogConfig = field(default_factory=FileLogConfig)
 
 
-# Global redactor instance for log sanitization
-_redactor: SecretRedactor | None = None
-
-
-def _get_redactor() -> SecretRedactor:
-    """Get or create the global secret redactor."""
-    global _redactor
-    if _redactor is None:
-        _redactor = SecretRedactor(placeholder="[REDACTED]")
-    return _redactor
+# Bound log context. All keys live in a single ContextVar holding an
+# immutable mapping, so each bind/unbind/clear is one ContextVar write and
+# each log line is one ContextVar read. Mappings are replaced, never mutated.
+_log_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    "ai_issue_agent_log_context", default=MappingProxyType({})
+)
 
 
 def sanitize_log_value(value: Any) -> Any:
@@ -83,7 +81,7 @@ def sanitize_log_value(value: Any) -> Any:
     Returns:
         Sanitized value with secrets redacted
     """
-    redactor = _get_redactor()
+    redactor = get_default_redactor()
 
     if isinstance(value, str):
         return redactor.redact(value)
@@ -150,6 +148,30 @@ def add_context_processor(
     return event_dict
 
 
+def merge_log_context(
+    logger: logging.Logger,
+    method_name: str,
+    event_dict: MutableMapping[str, Any],
+) -> MutableMapping[str, Any]:
+    """Merge context bound via bind_context() into the log entry.
+
+    Keys passed explicitly to the log call take precedence over bound
+    context values.
+
+    Args:
+        logger: Logger instance (unused)
+        method_name: Log method name (unused)
+        event_dict: Event dictionary to process
+
+    Returns:
+        Event dictionary with bound context merged in
+    """
+    context = _log_context.get()
+    if context:
+        return {**context, **event_dict}
+    return event_dict
+
+
 def configure_logging(
     level: LogLevel | str = LogLevel.INFO,
     log_format: LogFormat | str = LogFormat.JSON,
@@ -188,7 +210,7 @@ def configure_logging(
 
     # Build processor chain
     shared_processors: list[Any] = [
-        structlog.contextvars.merge_contextvars,
+        merge_log_context,
         add_context_processor,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
@@ -275,7 +297,7 @@ def bind_context(**kwargs: Any) -> None:
         bind_context(channel_id="C123", user_id="U456")
         log.info("processing_message")  # Includes channel_id and user_id
     """
-    structlog.contextvars.bind_contextvars(**kwargs)
+    _log_context.set(MappingProxyType({**_log_context.get(), **kwargs}))
 
 
 def unbind_context(*keys: str) -> None:
@@ -284,12 +306,13 @@ def unbind_context(*keys: str) -> None:
     Args:
         *keys: Keys to unbind
     """
-    structlog.contextvars.unbind_contextvars(*keys)
+    context = _log_context.get()
+    _log_context.set(MappingProxyType({k: v for k, v in context.items() if k not in keys}))
 
 
 def clear_context() -> None:
     """Clear all bound contextual variables."""
-    structlog.contextvars.clear_contextvars()
+    _log_context.set(MappingProxyType({}))
 
 
 class LogEventNames:
@@ -97,6 +97,11 @@ class Counter:
         with self._lock:
             return self._values.get(label_key, 0)
 
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        with self._lock:
+            self._values.clear()
+
     def get_all(self) -> list[MetricValue]:
         """Get all counter values with their labels.
 
@@ -184,6 +189,11 @@ class Gauge:
         with self._lock:
             return self._values.get(label_key, 0)
 
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        with self._lock:
+            self._values.clear()
+
     def get_all(self) -> list[MetricValue]:
         """Get all gauge values with their labels.
 
@@ -245,6 +255,11 @@ class Histogram:
         with self._lock:
             self._observations[label_key].append(value)
 
+    def reset(self) -> None:
+        """Clear all recorded observations."""
+        with self._lock:
+            self._observations.clear()
+
     def get_stats(self, labels: dict[str, str] | None = None) -> dict[str, float]:
         """Get histogram statistics.
 
@@ -419,6 +434,16 @@ class MetricsRegistry:
                     cls._instance = cls()
         return cls._instance
 
+    def reset_all(self) -> None:
+        """Reset every metric in the registry to its initial state.
+
+        Metrics are cleared in place, so existing references to them
+        remain valid.
+        """
+        for metric in vars(self).values():
+            if isinstance(metric, (Counter, Gauge, Histogram)):
+                metric.reset()
+
     def get_uptime_seconds(self) -> float:
         """Get agent uptime in seconds.
 
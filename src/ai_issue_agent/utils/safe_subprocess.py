@@ -18,12 +18,18 @@ import subprocess
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from ai_issue_agent.utils.security import SecurityError, validate_repo_name
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    # Runs a full command line with a timeout in seconds
+    CommandRunner = Callable[[list[str], int], Awaitable[subprocess.CompletedProcess[str]]]
+
 log = structlog.get_logger()
 
 
@@ -85,6 +91,31 @@ class CommandResult:
         return json.loads(self.stdout)
 
 
+async def run_in_thread(cmd: list[str], timeout: int) -> subprocess.CompletedProcess[str]:
+    """Run a command with subprocess.run in a worker thread.
+
+    This is SafeGHCli's default command runner.
+
+    Args:
+        cmd: Full command line, binary first.
+        timeout: Timeout in seconds.
+
+    Returns:
+        The completed process with text stdout and stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout.
+    """
+    return await asyncio.to_thread(
+        subprocess.run,
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        shell=False,  # CRITICAL: Never use shell=True
+    )
+
+
 class SafeGHCli:
     """Safe wrapper for GitHub CLI (gh) operations.
 
@@ -110,12 +141,15 @@ class SafeGHCli:
         self,
         gh_path: str | None = None,
         default_timeout: int = DEFAULT_TIMEOUT,
+        runner: CommandRunner | None = None,
     ) -> None:
         """Initialize the SafeGHCli wrapper.
 
         Args:
             gh_path: Path to the gh CLI binary. If None, uses PATH.
             default_timeout: Default timeout for commands in seconds.
+            runner: Coroutine function that executes a command line. If None,
+                uses run_in_thread (subprocess.run in a worker thread).
 
         Raises:
             GHCliError: If gh CLI is not found.
@@ -126,6 +160,7 @@ class SafeGHCli:
 
         self._gh_path: str = resolved_path
         self._default_timeout = default_timeout
+        self._runner: CommandRunner = runner or run_in_thread
 
     def _find_gh(self) -> str | None:
         """Find the gh CLI binary in PATH."""
@@ -203,18 +238,8 @@ class SafeGHCli:
         log.debug("executing_gh_command", command=cmd, timeout=effective_timeout)
 
         try:
-            # Use asyncio.to_thread to run subprocess in a thread pool
-            def run_sync() -> subprocess.CompletedProcess[str]:
-                return subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=effective_timeout,
-                    shell=False,  # CRITICAL: Never use shell=True
-                )
-
             proc = await asyncio.wait_for(
-                asyncio.to_thread(run_sync),
+                self._runner(cmd, effective_timeout),
                 timeout=effective_timeout + 5,  # Extra buffer for thread overhead
             )
 
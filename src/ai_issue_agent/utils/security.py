@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import ipaddress
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import structlog
 
@@ -34,17 +35,44 @@ class ValidationError(SecurityError):
     """Raised when input validation fails."""
 
 
-# Repository name validation pattern
-REPO_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+$")
+# Repository name validation pattern (GitHub caps repository names at 100 characters)
+REPO_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_.-]{1,100}/[a-zA-Z0-9_.-]{1,100}$")
 
 # Shell metacharacters that should never appear in repo names
 SHELL_METACHARACTERS = frozenset(
     [";", "|", "&", "`", "$", "(", ")", "{", "}", "<", ">", "\\", "\n", "\r", "\t", "\x00"]
 )
 
+# Translation table deleting every shell metacharacter in one C-level pass
+_SHELL_TRANS = str.maketrans(dict.fromkeys(SHELL_METACHARACTERS))
+
+# ANSI CSI escape sequences (colors, cursor movement, screen clearing)
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Translation table deleting control characters, keeping tab, newline and CR
+_CONTROL_TRANS = dict.fromkeys((*range(0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F))
+
+# Config key fragments whose values are masked ("key" also covers "api_key")
+_SENSITIVE_CONFIG_KEY = re.compile(r"token|key|secret|password|credential", re.IGNORECASE)
+
 # Allowed hosts for Ollama (SSRF prevention)
 ALLOWED_OLLAMA_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
 
+# URL schemes an Ollama base URL may use
+_OLLAMA_SCHEMES = frozenset({"http", "https"})
+
+# Leading global inline flags, e.g. "(?i)", which must be scoped before a
+# pattern can be embedded in a larger alternation
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scope_inline_flags(pattern_str: str) -> str:
+    """Rewrite a leading global flag group "(?i)..." as a scoped "(?i:...)"."""
+    match = _LEADING_FLAGS.match(pattern_str)
+    if match is None:
+        return pattern_str
+    return f"(?{match.group(1)}:{pattern_str[match.end() :]})"
+
 
 class SecretRedactor:
     """Detects and redacts secrets from text.
@@ -53,6 +81,18 @@ class SecretRedactor:
     compile or execute, it raises an exception rather than allowing potentially
     sensitive data to pass through.
 
+    The default patterns are also joined into a single alternation, compiled
+    with ``re`` like the per-pattern matchers. (An engine whose character
+    classes are ASCII-only, such as RE2, would miss secrets those matchers
+    find, and the early exit below would then let them through.) Custom
+    patterns are kept out of it, since joining renumbers their groups and
+    breaks backreferences; each is searched on its own. has_secrets() answers
+    with these searches, and redact() and scan() use them to return early for
+    text with no candidate at all. Otherwise they run every pattern on its
+    own: the alternation stops at the leftmost match, which can swallow the
+    start of an overlapping or adjacent secret, so redact() replaces the
+    union of all per-pattern spans instead.
+
     Usage:
         redactor = SecretRedactor()
         safe_text = redactor.redact(potentially_sensitive_text)
@@ -126,13 +166,14 @@ class SecretRedactor:
         # Twilio
         (r"SK[a-f0-9]{32}", "Twilio API key"),
         (r"AC[a-f0-9]{32}", "Twilio Account SID"),
-        # Internal infrastructure (private IPs)
-        (r"\b10\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "Private IP (10.x.x.x)"),
+        # Internal infrastructure (private IPs): 10.x, 172.16-31.x and 192.168.x
+        # share one pattern. Octets are range-checked in the regex itself, so a
+        # rejected candidate such as 999.x never consumes a private IP after it.
         (
-            r"\b172\.(1[6-9]|2\d|3[01])\.\d{1,3}\.\d{1,3}\b",
-            "Private IP (172.16-31.x.x)",
+            r"\b(?:10(?:\.(?:25[0-5]|2[0-4]\d|[01]?\d?\d)){3}"
+            r"|(?:172\.(?:1[6-9]|2\d|3[01])|192\.168)(?:\.(?:25[0-5]|2[0-4]\d|[01]?\d?\d)){2})\b",
+            "Private IP",
         ),
-        (r"\b192\.168\.\d{1,3}\.\d{1,3}\b", "Private IP (192.168.x.x)"),
     )
 
     def __init__(
@@ -149,23 +190,63 @@ class SecretRedactor:
         Raises:
             RedactionError: If any pattern fails to compile.
         """
-        self.placeholder = placeholder
+        self._placeholder = placeholder
         self._pattern_names: dict[re.Pattern[str], str] = {}
 
+        # Custom patterns are searched one by one rather than combined
+        self._custom_patterns: list[re.Pattern[str]] = []
+
         all_patterns = list(self.DEFAULT_PATTERNS)
         if custom_patterns:
             all_patterns.extend(custom_patterns)
 
         # Compile all patterns, fail if any are invalid
         try:
-            for pattern_str, name in all_patterns:
+            for index, (pattern_str, name) in enumerate(all_patterns):
                 compiled = re.compile(pattern_str)
                 self._pattern_names[compiled] = name
+                if index >= len(self.DEFAULT_PATTERNS):
+                    self._custom_patterns.append(compiled)
         except re.error as e:
             msg = f"Failed to compile secret pattern '{pattern_str}': {e}"
             log.error("pattern_compilation_failed", pattern=pattern_str, error=str(e))
             raise RedactionError(msg) from e
 
+        alternatives = [
+            f"(?:{_scope_inline_flags(pattern_str)})" for pattern_str, _ in self.DEFAULT_PATTERNS
+        ]
+
+        try:
+            self._combined = re.compile("|".join(alternatives))
+        except re.error as e:
+            msg = f"Failed to combine secret patterns: {e}"
+            log.error("pattern_compilation_failed", pattern="<combined>", error=str(e))
+            raise RedactionError(msg) from e
+
+    def _search(self, text: str) -> bool:
+        """Return True if any pattern matches somewhere in the text."""
+        return self._combined.search(text) is not None or any(
+            pattern.search(text) for pattern in self._custom_patterns
+        )
+
+    def _find_secrets(self, text: str) -> list[re.Match[str]]:
+        """Return every per-pattern secret match, ordered by start position.
+
+        Matches from different patterns may overlap. Ties keep pattern order.
+        """
+        # Any per-pattern match would also be found by _search()
+        if not self._search(text):
+            return []
+
+        found = [match for pattern in self._pattern_names for match in pattern.finditer(text)]
+        found.sort(key=lambda match: match.start())
+        return found
+
+    @property
+    def placeholder(self) -> str:
+        """Return the replacement string; read-only, as get_default_redactor() is shared."""
+        return self._placeholder
+
     @property
     def patterns(self) -> list[re.Pattern[str]]:
         """Return the list of compiled patterns."""
@@ -191,10 +272,23 @@ class SecretRedactor:
             return text
 
         try:
-            result = text
-            for pattern in self._pattern_names:
-                result = pattern.sub(self.placeholder, result)
-            return result
+            matches = self._find_secrets(text)
+            if not matches:
+                return text
+
+            # Replace the union of the match spans; overlapping matches share
+            # one placeholder
+            pieces: list[str] = []
+            end = 0
+            for match in matches:
+                if match.start() >= end:
+                    pieces.append(text[end : match.start()])
+                    pieces.append(self.placeholder)
+                    end = match.end()
+                elif match.end() > end:
+                    end = match.end()
+            pieces.append(text[end:])
+            return "".join(pieces)
         except Exception as e:
             msg = f"Redaction failed: {e}"
             log.error("redaction_failed", error=str(e))
@@ -207,8 +301,10 @@ class SecretRedactor:
             text: The text to scan for secrets.
 
         Returns:
-            List of (pattern_name, matched_text_preview, start, end) tuples.
-            The matched_text_preview shows only the first/last few characters.
+            List of (pattern_name, matched_text_preview, start, end) tuples in
+            order of position, one per pattern match; matches from different
+            patterns may overlap. The matched_text_preview shows only the
+            first/last few characters.
 
         Raises:
             RedactionError: If scanning fails for any reason.
@@ -218,15 +314,15 @@ class SecretRedactor:
 
         try:
             findings: list[tuple[str, str, int, int]] = []
-            for pattern, name in self._pattern_names.items():
-                for match in pattern.finditer(text):
-                    # Create a safe preview that doesn't expose the full secret
-                    matched = match.group()
-                    if len(matched) > 10:
-                        preview = f"{matched[:4]}...{matched[-4:]}"
-                    else:
-                        preview = f"{matched[:2]}..."
-                    findings.append((name, preview, match.start(), match.end()))
+            for match in self._find_secrets(text):
+                name = self._pattern_names[match.re]
+                # Create a safe preview that doesn't expose the full secret
+                matched = match.group()
+                if len(matched) > 10:
+                    preview = f"{matched[:4]}...{matched[-4:]}"
+                else:
+                    preview = f"{matched[:2]}..."
+                findings.append((name, preview, match.start(), match.end()))
             return findings
         except Exception as e:
             msg = f"Scanning failed: {e}"
@@ -249,19 +345,33 @@ class SecretRedactor:
             return False
 
         try:
-            return any(pattern.search(text) for pattern in self._pattern_names)
+            return self._search(text)
         except Exception as e:
             msg = f"Secret check failed: {e}"
             log.error("has_secrets_check_failed", error=str(e))
             raise RedactionError(msg) from e
 
 
+@lru_cache(maxsize=1)
+def get_default_redactor() -> SecretRedactor:
+    """Return the shared SecretRedactor built from the default patterns.
+
+    The redactor holds no per-call state and its placeholder is read-only, so
+    one instance (and one pattern compilation) can serve every caller that does not need a custom
+    placeholder or extra patterns.
+
+    Returns:
+        The process-wide default SecretRedactor.
+    """
+    return SecretRedactor()
+
+
 def validate_repo_name(repo: str) -> bool:
     """Validate that a repository name is safe.
 
     Repository names must match the pattern: owner/repo where both owner
-    and repo contain only alphanumeric characters, underscores, hyphens,
-    and periods.
+    and repo are 1-100 alphanumeric characters, underscores, hyphens, and
+    periods. The character class excludes every shell metacharacter.
 
     Args:
         repo: The repository name to validate (e.g., "owner/repo").
@@ -269,15 +379,12 @@ def validate_repo_name(repo: str) -> bool:
     Returns:
         True if the repository name is valid, False otherwise.
     """
-    if not repo:
+    # Cheap structural rejects before any regex work
+    if not repo or repo.count("/") != 1:
         return False
 
-    # Check for shell metacharacters
-    if any(char in repo for char in SHELL_METACHARACTERS):
-        return False
-
-    # Check against pattern
-    return bool(REPO_NAME_PATTERN.match(repo))
+    # fullmatch, unlike match with "$", cannot accept a trailing newline
+    return REPO_NAME_PATTERN.fullmatch(repo) is not None
 
 
 def sanitize_for_shell(text: str) -> str:
@@ -296,18 +403,18 @@ def sanitize_for_shell(text: str) -> str:
     if not text:
         return text
 
-    result = text
-    for char in SHELL_METACHARACTERS:
-        result = result.replace(char, "")
-
-    return result
+    return text.translate(_SHELL_TRANS)
 
 
 def validate_ollama_url(url: str, allow_remote: bool = False) -> bool:
     """Validate that an Ollama URL is safe (SSRF prevention).
 
     By default, only localhost URLs are allowed. Set allow_remote=True
-    to explicitly allow non-localhost URLs.
+    to explicitly allow non-localhost URLs. IP literals are checked
+    structurally, so IPv4-mapped IPv6 forms such as [::ffff:127.0.0.1] are
+    unwrapped, and link-local addresses (which include cloud metadata
+    endpoints such as 169.254.169.254) are rejected even when remote hosts
+    are allowed.
 
     Args:
         url: The Ollama base URL to validate.
@@ -320,28 +427,31 @@ def validate_ollama_url(url: str, allow_remote: bool = False) -> bool:
         return False
 
     try:
-        parsed = urlparse(url)
-        host = parsed.hostname
-
-        if not host:
-            return False
+        parts = urlsplit(url)
+        host = parts.hostname
+    except ValueError:
+        return False
 
-        # Check if it's in the allowed hosts
-        if host in ALLOWED_OLLAMA_HOSTS:
-            return True
+    if parts.scheme not in _OLLAMA_SCHEMES or not host:
+        return False
 
-        # Check if it's a loopback IP
-        try:
-            ip = ipaddress.ip_address(host)
-            if ip.is_loopback:
-                return True
-        except ValueError:
-            pass  # Not an IP address
+    # Check if it's in the allowed hosts
+    if host in ALLOWED_OLLAMA_HOSTS:
+        return True
 
-        # If remote hosts are allowed, permit it; otherwise reject
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        # A host name; only permitted if remote hosts are allowed
         return allow_remote
-    except Exception:
-        return False
+
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+
+    if ip.is_loopback:
+        return True
+
+    return allow_remote and not ip.is_link_local
 
 
 def redact_file_paths(text: str, base_paths: Sequence[str] | None = None) -> str:
@@ -394,13 +504,12 @@ def sanitize_for_logging(text: str) -> str:
     if not text:
         return text
 
-    # Remove ANSI escape codes
-    text = re.sub(r"\x1b\[[0-9;]*m", "", text)
+    # Remove ANSI escape codes first; ESC itself is a control character
+    if "\x1b" in text:
+        text = _ANSI_ESCAPE.sub("", text)
 
     # Remove other control characters (except newline, tab, carriage return)
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)
-
-    return text
+    return text.translate(_CONTROL_TRANS)
 
 
 def mask_config_value(key: str, value: str) -> str:
@@ -413,12 +522,9 @@ def mask_config_value(key: str, value: str) -> str:
     Returns:
         The masked value if the key indicates sensitivity, otherwise the original.
     """
-    sensitive_keys = {"token", "key", "secret", "password", "credential", "api_key"}
-
-    key_lower = key.lower()
-    if any(s in key_lower for s in sensitive_keys):
-        if len(value) > 8:
-            return f"{value[:4]}...{value[-4:]}"
-        return "***"
+    if _SENSITIVE_CONFIG_KEY.search(key) is None:
+        return value
 
-    return value
+    if len(value) > 8:
+        return f"{value[:4]}...{value[-4:]}"
+    return "***"
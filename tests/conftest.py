@@ -1,5 +1,7 @@
 """Shared test fixtures for AI Issue Agent."""
 
+import hashlib
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
@@ -10,6 +12,95 @@ TRACEBACKS_DIR = FIXTURES_DIR / "tracebacks"
 ISSUES_DIR = FIXTURES_DIR / "issues"
 SECURITY_DIR = FIXTURES_DIR / "security"
 
+# pytest cache key holding {test node id: digest} for cached_on tests that
+# passed, where the digest covers both the marked source and the test module
+_CACHED_ON_KEY = "ai_issue_agent/cached_on"
+_cached_on_digest = pytest.StashKey[str]()
+_cached_on_passed = pytest.StashKey[dict[str, str]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in flag for skipping tests of unchanged sources."""
+    parser.addoption(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip tests marked cached_on(path) when path and the test module are "
+            "unchanged since the test last passed in a green run."
+        ),
+    )
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 digest of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip cached_on tests whose source and test module are unchanged.
+
+    Runs last so that only the items left after -k/-m deselection are
+    considered; deselected tests never have a digest recorded.
+    """
+    cache = getattr(config, "cache", None)
+    if not config.getoption("--skip-unchanged") or cache is None:
+        return
+
+    recorded: dict[str, str] = cache.get(_CACHED_ON_KEY, {})
+    file_digests: dict[Path, str] = {}
+    for item in items:
+        marker = item.get_closest_marker("cached_on")
+        if marker is None:
+            continue
+        paths = (config.rootpath / marker.args[0], item.path)
+        for path in paths:
+            if path not in file_digests:
+                file_digests[path] = _file_digest(path)
+        digest = ":".join(file_digests[path] for path in paths)
+        if recorded.get(item.nodeid) == digest:
+            item.add_marker(pytest.mark.skip(reason="source and test unchanged since last pass"))
+        else:
+            item.stash[_cached_on_digest] = digest
+
+    config.stash[_cached_on_passed] = {}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """Note each cached_on test that passed, forgetting it if any phase failed."""
+    report = yield
+    digest = item.stash.get(_cached_on_digest, None)
+    passed = item.config.stash.get(_cached_on_passed, None)
+    if digest is not None and passed is not None:
+        if report.failed:
+            passed.pop(item.nodeid, None)
+        elif report.when == "call" and report.passed:
+            passed[item.nodeid] = digest
+    return report
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Record digests for the cached_on tests that passed in a green run.
+
+    pytest-xdist workers only see their own share of the tests, so they never
+    record; a parallel run leaves the recorded digests untouched.
+    """
+    config = session.config
+    cache = getattr(config, "cache", None)
+    passed = config.stash.get(_cached_on_passed, None)
+    if (
+        exitstatus != pytest.ExitCode.OK
+        or cache is None
+        or not passed
+        or hasattr(config, "workerinput")
+    ):
+        return
+    cache.set(_CACHED_ON_KEY, {**cache.get(_CACHED_ON_KEY, {}), **passed})
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
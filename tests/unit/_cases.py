@@ -0,0 +1,40 @@
+"""Shared parametrize tables for the unit tests.
+
+Each table is defined once so that a new case is a one-line change that
+every test using the table picks up.
+"""
+
+# Repository names that validate_repo_name() must reject
+MALICIOUS_REPOS: tuple[str, ...] = (
+    "owner/repo; rm -rf /",
+    "owner/repo$(whoami)",
+    "owner/repo`id`",
+    "../../../etc/passwd",
+    "owner/repo\nmalicious",
+    "owner/repo|cat /etc/passwd",
+    "owner/repo&& echo pwned",
+    "owner/repo\x00null",
+    "owner/repo<script>",
+    "owner/repo>output",
+    "owner/repo{bad}",
+    "",
+    "just-one-part",
+    "too/many/parts",
+    "/absolute/path",
+    "owner/repo\n",
+    "owner/" + "r" * 101,
+)
+
+# Repository names that validate_repo_name() must accept
+VALID_REPOS: tuple[str, ...] = (
+    "owner/repo",
+    "my-org/my-project",
+    "user123/repo_name",
+    "Org.Name/Repo.Name",
+    "a/b",
+    "CAPS/REPO",
+    "num123/456num",
+    "with-dash/and_underscore",
+    "with.dots/in.name",
+    "owner/" + "r" * 100,
+)
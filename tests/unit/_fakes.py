@@ -0,0 +1,68 @@
+"""Lightweight hand-written fakes for provider protocols.
+
+These stand in for AsyncMock on hot test paths: calls are plain method
+dispatch and are recorded in simple lists that tests can compare directly.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ai_issue_agent.models.message import ChatMessage, ChatReply
+
+
+class FakeChat:
+    """In-memory ChatProvider that records replies and reactions.
+
+    Attributes:
+        replies: Every reply sent, in order
+        reactions: ("add" | "remove", channel_id, message_id, reaction) tuples, in order
+        failures: Method name -> exception raised (after recording) when called
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no recorded calls and no configured failures."""
+        self.replies: list[ChatReply] = []
+        self.reactions: list[tuple[str, str, str, str]] = []
+        self.failures: dict[str, Exception] = {}
+        self.connected = False
+
+    def _maybe_fail(self, method: str) -> None:
+        """Raise the configured failure for a method, if any."""
+        if method in self.failures:
+            raise self.failures[method]
+
+    async def connect(self) -> None:
+        """Mark the fake as connected."""
+        self._maybe_fail("connect")
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        """Mark the fake as disconnected."""
+        self.connected = False
+
+    async def listen(self) -> AsyncIterator[ChatMessage]:
+        """Yield no messages."""
+        return
+        yield
+
+    async def send_reply(
+        self,
+        channel_id: str,
+        text: str,
+        thread_id: str | None = None,
+        blocks: list[dict[str, Any]] | None = None,
+    ) -> str:
+        """Record a reply and return a synthetic message ID."""
+        self.replies.append(ChatReply(channel_id, text, thread_id, blocks))
+        self._maybe_fail("send_reply")
+        return f"reply-{len(self.replies)}"
+
+    async def add_reaction(self, channel_id: str, message_id: str, reaction: str) -> None:
+        """Record an added reaction."""
+        self.reactions.append(("add", channel_id, message_id, reaction))
+        self._maybe_fail("add_reaction")
+
+    async def remove_reaction(self, channel_id: str, message_id: str, reaction: str) -> None:
+        """Record a removed reaction."""
+        self.reactions.append(("remove", channel_id, message_id, reaction))
+        self._maybe_fail("remove_reaction")
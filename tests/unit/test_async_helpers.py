@@ -95,6 +95,7 @@ class TestRetryDecorator:
         assert result == "success"
         assert call_count == 1
 
+    @pytest.mark.slow
     async def test_api_retry_retries_on_timeout(self) -> None:
         """Test retry on httpx.TimeoutException."""
         call_count = 0
@@ -111,6 +112,7 @@ class TestRetryDecorator:
         assert result == "success"
         assert call_count == 3
 
+    @pytest.mark.slow
     async def test_api_retry_retries_on_network_error(self) -> None:
         """Test retry on httpx.NetworkError."""
         call_count = 0
@@ -127,6 +129,7 @@ class TestRetryDecorator:
         assert result == "success"
         assert call_count == 2
 
+    @pytest.mark.slow
     async def test_api_retry_gives_up_after_max_attempts(self) -> None:
         """Test that retry stops after max attempts."""
 
@@ -1,5 +1,6 @@
 """Tests for IssueMatcher functionality."""
 
+import sys
 from datetime import datetime
 from unittest.mock import AsyncMock
 
@@ -9,6 +10,8 @@ from ai_issue_agent.config.schema import MatchingConfig
 from ai_issue_agent.core.issue_matcher import (
     IssueMatcher,
     SearchError,
+    _issue_text,
+    _load_multilingual_stop_words,
 )
 from ai_issue_agent.models.issue import Issue, IssueMatch, IssueSearchResult, IssueState
 from ai_issue_agent.models.traceback import ParsedTraceback, StackFrame
@@ -163,6 +166,80 @@ class TestIssueMatcher:
         assert "xyz" in terms
         assert "longer" in terms
 
+    def test_multilingual_stopwords_fallback_without_extra(
+        self,
+        mock_vcs: AsyncMock,
+        mock_llm: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that English stop words are used when the extra is missing."""
+        monkeypatch.setitem(sys.modules, "marisa_trie", None)
+        _load_multilingual_stop_words.cache_clear()
+        config = MatchingConfig(multilingual_stopwords=["de"])
+
+        matcher = IssueMatcher(mock_vcs, mock_llm, config)
+        terms = matcher._extract_key_terms("the quick brown fox")
+        _load_multilingual_stop_words.cache_clear()
+
+        assert "the" not in terms
+        assert "quick" in terms
+
+    def test_multilingual_stopwords_filters_other_languages(
+        self,
+        mock_vcs: AsyncMock,
+        mock_llm: AsyncMock,
+    ) -> None:
+        """Test that configured languages' stop words are filtered."""
+        pytest.importorskip("marisa_trie")
+        pytest.importorskip("stop_words")
+        _load_multilingual_stop_words.cache_clear()
+        config = MatchingConfig(multilingual_stopwords=["de"])
+
+        matcher = IssueMatcher(mock_vcs, mock_llm, config)
+        terms = matcher._extract_key_terms("der Schlüssel fehlt und the value")
+
+        assert "der" not in terms
+        assert "und" not in terms
+        assert "the" not in terms
+        assert "schlüssel" in terms
+        assert "value" in terms
+
+    def test_multilingual_stopwords_skips_unknown_language(
+        self,
+        mock_vcs: AsyncMock,
+        mock_llm: AsyncMock,
+    ) -> None:
+        """Test that an unknown language code is skipped instead of raising."""
+        pytest.importorskip("marisa_trie")
+        pytest.importorskip("stop_words")
+        _load_multilingual_stop_words.cache_clear()
+        config = MatchingConfig(multilingual_stopwords=["xx", "de"])
+
+        matcher = IssueMatcher(mock_vcs, mock_llm, config)
+        terms = matcher._extract_key_terms("der Schlüssel fehlt und the value")
+
+        assert "der" not in terms
+        assert "the" not in terms
+        assert "schlüssel" in terms
+
+    def test_multilingual_stopwords_unknown_language_only(
+        self,
+        mock_vcs: AsyncMock,
+        mock_llm: AsyncMock,
+    ) -> None:
+        """Test that only unknown language codes leave the English stop words."""
+        pytest.importorskip("marisa_trie")
+        pytest.importorskip("stop_words")
+        _load_multilingual_stop_words.cache_clear()
+        config = MatchingConfig(multilingual_stopwords=["xx"])
+
+        matcher = IssueMatcher(mock_vcs, mock_llm, config)
+        terms = matcher._extract_key_terms("der Schlüssel and the value")
+
+        assert "the" not in terms
+        assert "der" in terms
+        assert "value" in terms
+
     @pytest.mark.asyncio
     async def test_find_matches_no_results(
         self,
@@ -349,6 +426,26 @@ class TestIssueMatcher:
         # No project frames, should be 0
         assert score == 0.0
 
+    def test_issue_text_shared_across_strategies(
+        self,
+        issue_matcher: IssueMatcher,
+        sample_traceback: ParsedTraceback,
+        sample_issue: Issue,
+    ) -> None:
+        """Test that issue text is built once and reused by each strategy."""
+        _issue_text.cache_clear()
+
+        issue_matcher._calculate_exact_score(sample_traceback, sample_issue)
+        issue_matcher._calculate_stack_score(sample_traceback, sample_issue)
+
+        info = _issue_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert (
+            _issue_text(sample_issue.number, sample_issue.title, sample_issue.body)
+            == f"{sample_issue.title} {sample_issue.body}".lower()
+        )
+
     def test_set_strategy_weight(
         self,
         issue_matcher: IssueMatcher,
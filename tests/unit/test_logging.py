@@ -9,6 +9,7 @@ from ai_issue_agent.utils.logging import (
     clear_context,
     configure_logging,
     get_logger,
+    merge_log_context,
     sanitize_log_value,
     secret_sanitizer,
     unbind_context,
@@ -145,6 +146,25 @@ class TestContextFunctions:
         unbind_context("key1")
         clear_context()
 
+    def test_merge_log_context(self) -> None:
+        """Test that bound context is merged into log entries."""
+        bind_context(channel_id="C123", user_id="U456")
+        bind_context(user_id="U789")
+        unbind_context("channel_id")
+        result = merge_log_context(None, "info", {"event": "test"})  # type: ignore
+        assert result == {"user_id": "U789", "event": "test"}
+
+        clear_context()
+        result = merge_log_context(None, "info", {"event": "test"})  # type: ignore
+        assert result == {"event": "test"}
+
+    def test_merge_log_context_event_takes_precedence(self) -> None:
+        """Test that explicit log call values override bound context."""
+        bind_context(channel_id="C123")
+        result = merge_log_context(None, "info", {"channel_id": "C999"})  # type: ignore
+        assert result["channel_id"] == "C999"
+        clear_context()
+
 
 class TestLogLevel:
     """Tests for LogLevel enum."""
@@ -72,7 +72,7 @@ class TestChatMessage:
             raw_event=raw_event,
         )
 
-        assert message.raw_event == raw_event
+        assert message.raw_event is raw_event
         assert message.raw_event["type"] == "message"
 
     def test_frozen_immutable(self) -> None:
@@ -1,6 +1,9 @@
 """Tests for the metrics collection module."""
 
-import time
+import re
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -14,45 +17,80 @@ from ai_issue_agent.utils.metrics import (
     get_metrics,
 )
 
+# Every test here exercises only the metrics module
+pytestmark = pytest.mark.cached_on("src/ai_issue_agent/utils/metrics.py")
 
-class TestCounter:
-    """Tests for Counter metric."""
+# Label sets reused across tests; the metrics never mutate the dicts passed in
+_LBL_SUCCESS = {"type": "success"}
+_LBL_ERROR = {"type": "error"}
+_LBL_UNKNOWN = {"type": "unknown"}
+_LBL_SERVER1 = {"host": "server1"}
+_LBL_SERVER2 = {"host": "server2"}
+_LBL_READ = {"operation": "read"}
+_LBL_TEST = {"operation": "test"}
 
-    def test_counter_initial_value(self) -> None:
-        """Test counter starts at zero."""
-        counter = Counter("test_counter", "Test counter")
-        assert counter.get() == 0
+# Counter TYPE lines are exported before gauge TYPE lines
+_PROMETHEUS_PATTERN = re.compile(r"# TYPE ai_issue_agent_\S+ counter.*# TYPE \S+ gauge", re.DOTALL)
 
-    def test_counter_increment_by_one(self) -> None:
-        """Test counter increment by default value."""
-        counter = Counter("test_counter")
-        counter.inc()
-        assert counter.get() == 1
 
-    def test_counter_increment_by_value(self) -> None:
-        """Test counter increment by specific value."""
-        counter = Counter("test_counter")
-        counter.inc(5)
-        assert counter.get() == 5
+@pytest.fixture(scope="module")
+def _shared_registry() -> MetricsRegistry:
+    """Create one registry shared by the tests in this module."""
+    return MetricsRegistry()
 
-    def test_counter_multiple_increments(self) -> None:
-        """Test multiple counter increments."""
-        counter = Counter("test_counter")
-        counter.inc()
-        counter.inc(3)
-        counter.inc(2)
-        assert counter.get() == 6
+
+@pytest.fixture
+def fresh_registry(_shared_registry: MetricsRegistry) -> Iterator[MetricsRegistry]:
+    """Provide the shared registry with every metric reset."""
+    _shared_registry.reset_all()
+    yield _shared_registry
+
+
+@pytest.fixture(scope="module")
+def all_metrics_snapshot() -> dict[str, Any]:
+    """Enumerate a new registry's metrics once for the whole module."""
+    return MetricsRegistry().get_all_metrics()
+
+
+@pytest.fixture
+def clean_singleton(monkeypatch: pytest.MonkeyPatch) -> MetricsRegistry:
+    """Provide a fresh global registry, restoring the previous one afterwards."""
+    monkeypatch.setattr(MetricsRegistry, "_instance", None)
+    return get_metrics()
+
+
+class TestCounter:
+    """Tests for Counter metric."""
+
+    @pytest.mark.parametrize(
+        ("ops", "expected"),
+        [
+            pytest.param([], 0, id="initial_value"),
+            pytest.param([None], 1, id="increment_by_one"),
+            pytest.param([5], 5, id="increment_by_value"),
+            pytest.param([None, 3, 2], 6, id="multiple_increments"),
+        ],
+    )
+    def test_counter_increments(self, ops: list[float | None], expected: float) -> None:
+        """Test counter value after a sequence of increments (None means the default)."""
+        counter = Counter("test_counter", "Test counter")
+        for amount in ops:
+            if amount is None:
+                counter.inc()
+            else:
+                counter.inc(amount)
+        assert counter.get() == expected
 
     def test_counter_with_labels(self) -> None:
         """Test counter with labels."""
         counter = Counter("test_counter")
-        counter.inc(labels={"type": "success"})
-        counter.inc(labels={"type": "error"})
-        counter.inc(labels={"type": "success"})
+        counter.inc(labels=_LBL_SUCCESS)
+        counter.inc(labels=_LBL_ERROR)
+        counter.inc(labels=_LBL_SUCCESS)
 
-        assert counter.get(labels={"type": "success"}) == 2
-        assert counter.get(labels={"type": "error"}) == 1
-        assert counter.get(labels={"type": "unknown"}) == 0
+        assert counter.get(labels=_LBL_SUCCESS) == 2
+        assert counter.get(labels=_LBL_ERROR) == 1
+        assert counter.get(labels=_LBL_UNKNOWN) == 0
 
     def test_counter_cannot_decrease(self) -> None:
         """Test that counter rejects negative values."""
@@ -60,6 +98,16 @@ class TestCounter:
         with pytest.raises(ValueError, match="can only increase"):
             counter.inc(-1)
 
+    def test_counter_reset(self) -> None:
+        """Test that reset clears all counter values."""
+        counter = Counter("test_counter")
+        counter.inc(3)
+        counter.inc(labels=_LBL_ERROR)
+        counter.reset()
+
+        assert counter.get() == 0
+        assert counter.get_all() == []
+
     def test_counter_get_all(self) -> None:
         """Test getting all counter values."""
         counter = Counter("test_counter", "Help text")
@@ -74,45 +122,40 @@ class TestCounter:
 class TestGauge:
     """Tests for Gauge metric."""
 
-    def test_gauge_initial_value(self) -> None:
-        """Test gauge starts at zero."""
+    @pytest.mark.parametrize(
+        ("ops", "expected"),
+        [
+            pytest.param([], 0, id="initial_value"),
+            pytest.param([("set", 42)], 42, id="set_value"),
+            pytest.param([("set", 10), ("inc", 1)], 11, id="increment"),
+            pytest.param([("set", 10), ("dec", 1)], 9, id="decrement"),
+            pytest.param([("set", -5)], -5, id="can_be_negative"),
+        ],
+    )
+    def test_gauge_operations(self, ops: list[tuple[str, float]], expected: float) -> None:
+        """Test gauge value after a sequence of operations."""
         gauge = Gauge("test_gauge", "Test gauge")
-        assert gauge.get() == 0
+        for method, value in ops:
+            getattr(gauge, method)(value)
+        assert gauge.get() == expected
 
-    def test_gauge_set_value(self) -> None:
-        """Test setting gauge value."""
+    def test_gauge_with_labels(self) -> None:
+        """Test gauge with labels."""
         gauge = Gauge("test_gauge")
-        gauge.set(42)
-        assert gauge.get() == 42
+        gauge.set(10, labels=_LBL_SERVER1)
+        gauge.set(20, labels=_LBL_SERVER2)
 
-    def test_gauge_increment(self) -> None:
-        """Test gauge increment."""
-        gauge = Gauge("test_gauge")
-        gauge.set(10)
-        gauge.inc()
-        assert gauge.get() == 11
+        assert gauge.get(labels=_LBL_SERVER1) == 10
+        assert gauge.get(labels=_LBL_SERVER2) == 20
 
-    def test_gauge_decrement(self) -> None:
-        """Test gauge decrement."""
+    def test_gauge_reset(self) -> None:
+        """Test that reset clears all gauge values."""
         gauge = Gauge("test_gauge")
         gauge.set(10)
-        gauge.dec()
-        assert gauge.get() == 9
-
-    def test_gauge_can_be_negative(self) -> None:
-        """Test gauge can have negative values."""
-        gauge = Gauge("test_gauge")
-        gauge.set(-5)
-        assert gauge.get() == -5
-
-    def test_gauge_with_labels(self) -> None:
-        """Test gauge with labels."""
-        gauge = Gauge("test_gauge")
-        gauge.set(10, labels={"host": "server1"})
-        gauge.set(20, labels={"host": "server2"})
+        gauge.reset()
 
-        assert gauge.get(labels={"host": "server1"}) == 10
-        assert gauge.get(labels={"host": "server2"}) == 20
+        assert gauge.get() == 0
+        assert gauge.get_all() == []
 
 
 class TestHistogram:
@@ -165,45 +208,54 @@ class TestHistogram:
     def test_histogram_with_labels(self) -> None:
         """Test histogram with labels."""
         histogram = Histogram("test_histogram")
-        histogram.observe(1.0, labels={"operation": "read"})
+        histogram.observe(1.0, labels=_LBL_READ)
         histogram.observe(2.0, labels={"operation": "write"})
 
-        read_stats = histogram.get_stats(labels={"operation": "read"})
+        read_stats = histogram.get_stats(labels=_LBL_READ)
         assert read_stats["count"] == 1
         assert read_stats["sum"] == 1.0
 
+    def test_histogram_reset(self) -> None:
+        """Test that reset clears all observations."""
+        histogram = Histogram("test_histogram")
+        histogram.observe(1.0)
+        histogram.reset()
+
+        assert histogram.get_stats()["count"] == 0
+
 
 class TestMetricsRegistry:
     """Tests for MetricsRegistry singleton."""
 
-    def test_singleton_instance(self) -> None:
+    def test_singleton_instance(self, clean_singleton: MetricsRegistry) -> None:
         """Test that get_instance returns singleton."""
-        instance1 = MetricsRegistry.get_instance()
-        instance2 = MetricsRegistry.get_instance()
-        assert instance1 is instance2
+        assert MetricsRegistry.get_instance() is clean_singleton
+        assert MetricsRegistry.get_instance() is clean_singleton
 
-    def test_get_metrics_function(self) -> None:
+    def test_get_metrics_function(self, clean_singleton: MetricsRegistry) -> None:
         """Test get_metrics convenience function."""
-        registry = get_metrics()
-        assert isinstance(registry, MetricsRegistry)
+        assert isinstance(clean_singleton, MetricsRegistry)
+        assert get_metrics() is clean_singleton
 
-    def test_registry_has_expected_metrics(self) -> None:
+    def test_registry_has_expected_metrics(self, clean_singleton: MetricsRegistry) -> None:
         """Test that registry has expected metrics."""
-        registry = get_metrics()
-
-        assert hasattr(registry, "messages_received")
-        assert hasattr(registry, "messages_processed")
-        assert hasattr(registry, "issues_created")
-        assert hasattr(registry, "issues_linked")
-        assert hasattr(registry, "llm_requests")
-        assert hasattr(registry, "processing_duration")
-        assert hasattr(registry, "cache_hits")
-        assert hasattr(registry, "active_tasks")
-
-    def test_registry_get_all_metrics(self) -> None:
+        expected = {
+            "messages_received",
+            "messages_processed",
+            "issues_created",
+            "issues_linked",
+            "llm_requests",
+            "processing_duration",
+            "cache_hits",
+            "active_tasks",
+        }
+
+        missing = expected - vars(clean_singleton).keys()
+        assert not missing, f"missing metrics: {missing}"
+
+    def test_registry_get_all_metrics(self, all_metrics_snapshot: dict[str, Any]) -> None:
         """Test getting all metrics as dictionary."""
-        registry = get_metrics()
-        metrics = registry.get_all_metrics()
+        metrics = all_metrics_snapshot
 
         assert "uptime_seconds" in metrics
         assert "messages" in metrics
@@ -211,21 +263,40 @@ class TestMetricsRegistry:
         assert "llm" in metrics
         assert "cache" in metrics
 
-    def test_registry_uptime(self) -> None:
+    def test_registry_get_all_metrics_starts_empty(
+        self, all_metrics_snapshot: dict[str, Any]
+    ) -> None:
+        """Test that a new registry reports zero for every counter."""
+        assert all_metrics_snapshot["messages"] == {"received": 0, "processed": 0, "errors": 0}
+        assert all_metrics_snapshot["issues"] == {"created": 0, "linked": 0, "searches": 0}
+        assert all_metrics_snapshot["processing"]["duration_stats"]["count"] == 0
+
+    def test_registry_uptime(self, clean_singleton: MetricsRegistry) -> None:
         """Test uptime tracking."""
-        registry = get_metrics()
+        registry = clean_singleton
         uptime = registry.get_uptime_seconds()
         assert uptime >= 0
 
-    def test_registry_prometheus_format(self) -> None:
+    def test_registry_reset_all(self, fresh_registry: MetricsRegistry) -> None:
+        """Test that reset_all zeroes every metric in place."""
+        counter = fresh_registry.messages_received
+        counter.inc()
+        fresh_registry.active_tasks.set(3)
+        fresh_registry.processing_duration.observe(0.5)
+
+        fresh_registry.reset_all()
+
+        assert fresh_registry.messages_received is counter
+        assert counter.get() == 0
+        assert fresh_registry.active_tasks.get() == 0
+        assert fresh_registry.processing_duration.get_stats()["count"] == 0
+
+    def test_registry_prometheus_format(self, clean_singleton: MetricsRegistry) -> None:
         """Test Prometheus format export."""
-        registry = get_metrics()
+        registry = clean_singleton
         output = registry.to_prometheus_format()
 
-        assert "# TYPE" in output
-        assert "ai_issue_agent_" in output
-        assert "counter" in output
-        assert "gauge" in output
+        assert _PROMETHEUS_PATTERN.search(output)
 
 
 class TestTimer:
@@ -235,21 +306,24 @@ class TestTimer:
         """Test that timer records duration."""
         histogram = Histogram("test_timer")
 
-        with Timer(histogram):
-            time.sleep(0.01)  # Sleep 10ms
+        with (
+            patch("ai_issue_agent.utils.metrics.time.perf_counter", side_effect=[1.0, 1.25]),
+            Timer(histogram),
+        ):
+            pass
 
         stats = histogram.get_stats()
         assert stats["count"] == 1
-        assert stats["sum"] >= 0.01
+        assert stats["sum"] == 0.25
 
     def test_timer_with_labels(self) -> None:
         """Test timer with labels."""
         histogram = Histogram("test_timer")
 
-        with Timer(histogram, labels={"operation": "test"}):
+        with Timer(histogram, labels=_LBL_TEST):
             pass
 
-        stats = histogram.get_stats(labels={"operation": "test"})
+        stats = histogram.get_stats(labels=_LBL_TEST)
         assert stats["count"] == 1
 
     def test_timer_records_on_exception(self) -> None:
@@ -266,10 +340,9 @@ class TestTimer:
 class TestMetricIntegration:
     """Integration tests for metrics."""
 
-    def test_message_processing_workflow(self) -> None:
+    def test_message_processing_workflow(self, fresh_registry: MetricsRegistry) -> None:
         """Test typical message processing workflow."""
-        # Create fresh registry for this test
-        registry = MetricsRegistry()
+        registry = fresh_registry
 
         # Simulate receiving a message
         registry.messages_received.inc()
@@ -300,9 +373,9 @@ class TestMetricIntegration:
         assert registry.llm_tokens_used.get() == 500
         assert registry.active_tasks.get() == 0
 
-    def test_error_handling_workflow(self) -> None:
+    def test_error_handling_workflow(self, fresh_registry: MetricsRegistry) -> None:
         """Test error handling workflow."""
-        registry = MetricsRegistry()
+        registry = fresh_registry
 
         # Simulate receiving a message
         registry.messages_received.inc()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import re
+import subprocess
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -18,6 +21,48 @@ from ai_issue_agent.utils.safe_subprocess import (
     SafeGHCli,
 )
 from ai_issue_agent.utils.security import SecurityError
+from tests.unit._cases import MALICIOUS_REPOS
+
+# Message raised by SafeGHCli._validate_repo, compiled once for every pytest.raises
+_INVALID_REPO = re.compile("Invalid repository name")
+
+
+def _proc(
+    stdout: str = "", stderr: str = "", returncode: int = 0
+) -> subprocess.CompletedProcess[str]:
+    """Build the completed process a command runner returns."""
+    return subprocess.CompletedProcess(["gh"], returncode, stdout, stderr)
+
+
+class _RecordingRunner:
+    """Command runner that records each command line and returns a canned result."""
+
+    def __init__(self) -> None:
+        """Start with a successful empty result and no recorded commands."""
+        self.result = _proc()
+        self.error: BaseException | None = None
+        self.commands: list[list[str]] = []
+        self.timeouts: list[int] = []
+
+    async def __call__(self, cmd: list[str], timeout: int) -> subprocess.CompletedProcess[str]:
+        """Record the command, then raise the configured error or return the result."""
+        self.commands.append(cmd)
+        self.timeouts.append(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def runner() -> _RecordingRunner:
+    """Create a recording command runner."""
+    return _RecordingRunner()
+
+
+@pytest.fixture
+def stub_gh(runner: _RecordingRunner) -> SafeGHCli:
+    """Create a SafeGHCli that sends commands to the recording runner."""
+    return SafeGHCli(gh_path="/usr/bin/gh", runner=runner)
 
 
 class TestCommandResult:
@@ -80,67 +125,24 @@ class TestSafeGHCliInit:
 class TestSafeGHCliValidation:
     """Test input validation in SafeGHCli."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    @pytest.mark.parametrize(
-        "malicious_repo",
-        [
-            "owner/repo; rm -rf /",
-            "owner/repo$(whoami)",
-            "owner/repo`id`",
-            "../../../etc/passwd",
-            "owner/repo\nmalicious",
-        ],
-    )
-    async def test_rejects_malicious_repo_in_search(
-        self, gh: SafeGHCli, malicious_repo: str
-    ) -> None:
-        """Test that malicious repo names are rejected in search."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
-            await gh.search_issues(malicious_repo, "query")
-
-    @pytest.mark.parametrize(
-        "malicious_repo",
-        [
-            "owner/repo; rm -rf /",
-            "owner/repo$(whoami)",
-        ],
-    )
-    async def test_rejects_malicious_repo_in_get_issue(
-        self, gh: SafeGHCli, malicious_repo: str
-    ) -> None:
-        """Test that malicious repo names are rejected in get_issue."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
-            await gh.get_issue(malicious_repo, 123)
-
-    @pytest.mark.parametrize(
-        "malicious_repo",
-        [
-            "owner/repo; rm -rf /",
-            "owner/repo$(whoami)",
-        ],
-    )
-    async def test_rejects_malicious_repo_in_create_issue(
-        self, gh: SafeGHCli, malicious_repo: str
+    @pytest.mark.parametrize("malicious_repo", MALICIOUS_REPOS)
+    def test_validate_repo_rejects_malicious(self, gh: SafeGHCli, malicious_repo: str) -> None:
+        """Test that the shared repo check rejects malicious names."""
+        with pytest.raises(SecurityError, match=_INVALID_REPO):
+            gh._validate_repo(malicious_repo)
+
+    async def test_search_issues_rejects_invalid_repo(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
     ) -> None:
-        """Test that malicious repo names are rejected in create_issue."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
-            await gh.create_issue(malicious_repo, "Title", "Body")
+        """Test that a public method runs the repo check before any command."""
+        with pytest.raises(SecurityError, match=_INVALID_REPO):
+            await stub_gh.search_issues("owner/repo; rm -rf /", "query")
+        assert runner.commands == []
 
 
 class TestSafeGHCliErrorParsing:
     """Test error parsing in SafeGHCli."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
     def test_parses_auth_error(self, gh: SafeGHCli) -> None:
         """Test parsing authentication errors."""
         result = CommandResult(
@@ -213,308 +215,224 @@ class TestSafeGHCliErrorParsing:
 class TestSafeGHCliCommands:
     """Test SafeGHCli command execution."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    @pytest.fixture
-    def mock_subprocess(self) -> MagicMock:
-        """Create a mock for subprocess.run."""
-        mock = MagicMock()
-        mock.stdout = '{"number": 123}'
-        mock.stderr = ""
-        mock.returncode = 0
-        return mock
-
-    async def test_search_issues_builds_correct_command(self, gh: SafeGHCli) -> None:
+    async def test_search_issues_builds_correct_command(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test that search_issues builds the correct command."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = "[]"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout="[]")
 
-            await gh.search_issues("owner/repo", "bug fix", state="open", limit=5)
+        await stub_gh.search_issues("owner/repo", "bug fix", state="open", limit=5)
 
-            # Verify the function was called
-            mock_thread.assert_called_once()
+        (cmd,) = runner.commands
+        assert cmd[:5] == ["/usr/bin/gh", "issue", "list", "--repo", "owner/repo"]
+        assert cmd[cmd.index("--search") + 1] == "bug fix"
+        assert cmd[cmd.index("--state") + 1] == "open"
+        assert cmd[cmd.index("--limit") + 1] == "5"
 
-    async def test_search_issues_sanitizes_state(self, gh: SafeGHCli) -> None:
+    async def test_search_issues_sanitizes_state(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test that invalid state values are sanitized."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = "[]"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout="[]")
 
-            # Invalid state should be replaced with "all"
-            await gh.search_issues("owner/repo", "query", state="invalid")
+        await stub_gh.search_issues("owner/repo", "query", state="invalid")
 
-            # The command should have been called (state sanitized internally)
-            mock_thread.assert_called_once()
+        (cmd,) = runner.commands
+        assert cmd[cmd.index("--state") + 1] == "all"
 
-    async def test_search_issues_limits_results(self, gh: SafeGHCli) -> None:
+    async def test_search_issues_limits_results(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test that limit is bounded between 1 and 100."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = "[]"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout="[]")
 
-            # Limit should be bounded
-            await gh.search_issues("owner/repo", "query", limit=1000)
-            mock_thread.assert_called_once()
+        await stub_gh.search_issues("owner/repo", "query", limit=1000)
 
-    async def test_check_auth_returns_true_when_authenticated(self, gh: SafeGHCli) -> None:
+        (cmd,) = runner.commands
+        assert cmd[cmd.index("--limit") + 1] == "100"
+
+    async def test_check_auth_returns_true_when_authenticated(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test check_auth returns True when authenticated."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = "Logged in to github.com"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout="Logged in to github.com")
 
-            result = await gh.check_auth()
-            assert result is True
+        assert await stub_gh.check_auth() is True
+        assert runner.commands == [["/usr/bin/gh", "auth", "status"]]
 
-    async def test_check_auth_returns_false_when_not_authenticated(self, gh: SafeGHCli) -> None:
+    async def test_check_auth_returns_false_when_not_authenticated(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test check_auth returns False when not authenticated."""
+        runner.result = _proc(stderr="Not logged in", returncode=1)
+
+        assert await stub_gh.check_auth() is False
+
+    async def test_default_runner_runs_in_thread(self, gh: SafeGHCli) -> None:
+        """Test that the default runner executes subprocess.run in a worker thread."""
         with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = ""
-            mock_proc.stderr = "Not logged in"
-            mock_proc.returncode = 1
-            mock_thread.return_value = mock_proc
+            mock_thread.return_value = _proc(stdout="Logged in to github.com")
 
-            result = await gh.check_auth()
-            assert result is False
+            assert await gh.check_auth() is True
+
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args.args[:2] == (
+            subprocess.run,
+            ["/usr/bin/gh", "auth", "status"],
+        )
+        assert mock_thread.call_args.kwargs["shell"] is False
 
 
 class TestSafeGHCliClone:
     """Test repository cloning with security measures."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    async def test_clone_disables_hooks(self, gh: SafeGHCli, tmp_path: Path) -> None:
+    async def test_clone_disables_hooks(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner, tmp_path: Path
+    ) -> None:
         """Test that clone disables git hooks for security."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = ""
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
-
-            await gh.clone_repository("owner/repo", tmp_path)
+        repo_path = await stub_gh.clone_repository("owner/repo", tmp_path)
 
-            # Verify the mock was called
-            mock_thread.assert_called_once()
-            # The actual command includes -c core.hooksPath=/dev/null
-            # which is verified through integration tests
+        assert repo_path == tmp_path / "repo"
+        (cmd,) = runner.commands
+        assert cmd[cmd.index("--") + 1 :][:2] == ["-c", "core.hooksPath=/dev/null"]
+        assert runner.timeouts == [SafeGHCli.CLONE_TIMEOUT]
 
     async def test_clone_validates_repo_name(self, gh: SafeGHCli, tmp_path: Path) -> None:
         """Test that clone validates repository names."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
+        with pytest.raises(SecurityError, match=_INVALID_REPO):
             await gh.clone_repository("malicious; rm -rf /", tmp_path)
 
 
 class TestSafeGHCliTimeout:
     """Test timeout handling."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli(default_timeout=1)
-
-    async def test_command_timeout_raises_error(self, gh: SafeGHCli) -> None:
+    async def test_command_timeout_raises_error(self, runner: _RecordingRunner) -> None:
         """Test that command timeout raises CommandTimeoutError."""
+        gh = SafeGHCli(gh_path="/usr/bin/gh", default_timeout=1, runner=runner)
+        runner.error = TimeoutError()
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.side_effect = TimeoutError()
+        with pytest.raises(CommandTimeoutError):
+            await gh.search_issues("owner/repo", "query")
 
-            with pytest.raises(CommandTimeoutError):
-                await gh.search_issues("owner/repo", "query")
+        assert runner.timeouts == [1]
+
+    async def test_subprocess_timeout_raises_error(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
+        """Test that subprocess.TimeoutExpired is reported as CommandTimeoutError."""
+        runner.error = subprocess.TimeoutExpired(["gh"], 30)
+
+        with pytest.raises(CommandTimeoutError):
+            await stub_gh.search_issues("owner/repo", "query")
 
 
 class TestSafeGHCliGetIssue:
     """Test get_issue method."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    async def test_get_issue_builds_correct_command(self, gh: SafeGHCli) -> None:
+    async def test_get_issue_builds_correct_command(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test that get_issue builds the correct command."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = '{"number": 42}'
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout='{"number": 42}')
 
-            result = await gh.get_issue("owner/repo", 42)
+        result = await stub_gh.get_issue("owner/repo", 42)
 
-            assert result.success
-            mock_thread.assert_called_once()
+        assert result.success
+        (cmd,) = runner.commands
+        assert cmd[:6] == ["/usr/bin/gh", "issue", "view", "42", "--repo", "owner/repo"]
 
     async def test_get_issue_validates_repo(self, gh: SafeGHCli) -> None:
         """Test that get_issue validates repository name."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
+        with pytest.raises(SecurityError, match=_INVALID_REPO):
             await gh.get_issue("malicious; rm -rf /", 42)
 
 
 class TestSafeGHCliCreateIssue:
     """Test create_issue method."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    async def test_create_issue_with_labels(self, gh: SafeGHCli) -> None:
+    async def test_create_issue_with_labels(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test creating an issue with labels."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = '{"number": 100}'
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
-
-            result = await gh.create_issue(
-                "owner/repo",
-                "Test Issue",
-                "Issue body",
-                labels=["bug", "high-priority"],
-            )
-
-            assert result.success
-            mock_thread.assert_called_once()
-
-    async def test_create_issue_without_labels(self, gh: SafeGHCli) -> None:
+        runner.result = _proc(stdout='{"number": 100}')
+
+        result = await stub_gh.create_issue(
+            "owner/repo",
+            "Test Issue",
+            "Issue body",
+            labels=["bug", "high-priority"],
+        )
+
+        assert result.success
+        (cmd,) = runner.commands
+        assert cmd[-4:] == ["--label", "bug", "--label", "high-priority"]
+
+    async def test_create_issue_without_labels(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test creating an issue without labels."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = '{"number": 101}'
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout='{"number": 101}')
 
-            result = await gh.create_issue("owner/repo", "Test Issue", "Body")
+        result = await stub_gh.create_issue("owner/repo", "Test Issue", "Body")
 
-            assert result.success
+        assert result.success
+        assert "--label" not in runner.commands[0]
 
 
 class TestSafeGHCliGetFileContent:
     """Test get_file_content method."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    async def test_get_file_content_returns_content(self, gh: SafeGHCli) -> None:
+    async def test_get_file_content_returns_content(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test getting file content."""
-        import base64
-
         # The API returns base64-encoded content
         content_text = "def hello(): pass"
-        content_b64 = base64.b64encode(content_text.encode()).decode()
-
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = content_b64
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stdout=base64.b64encode(content_text.encode()).decode())
 
-            content = await gh.get_file_content("owner/repo", "src/hello.py")
+        content = await stub_gh.get_file_content("owner/repo", "src/hello.py")
 
-            assert content == content_text
+        assert content == content_text
+        assert runner.commands[0][1:3] == ["api", "/repos/owner/repo/contents/src/hello.py"]
 
-    async def test_get_file_content_with_ref(self, gh: SafeGHCli) -> None:
+    async def test_get_file_content_with_ref(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test getting file content at a specific ref."""
-        import base64
-
         content_text = "# Old version"
-        content_b64 = base64.b64encode(content_text.encode()).decode()
+        runner.result = _proc(stdout=base64.b64encode(content_text.encode()).decode())
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = content_b64
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
-
-            content = await gh.get_file_content("owner/repo", "README.md", ref="v1.0.0")
+        content = await stub_gh.get_file_content("owner/repo", "README.md", ref="v1.0.0")
 
-            assert content == content_text
+        assert content == content_text
+        assert runner.commands[0][2] == "/repos/owner/repo/contents/README.md?ref=v1.0.0"
 
-    async def test_get_file_content_not_found_returns_none(self, gh: SafeGHCli) -> None:
+    async def test_get_file_content_not_found_returns_none(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner
+    ) -> None:
         """Test getting non-existent file returns None (NotFoundError is caught)."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            mock_proc.stdout = ""
-            mock_proc.stderr = "Could not resolve to a Blob"
-            mock_proc.returncode = 1
-            mock_thread.return_value = mock_proc
+        runner.result = _proc(stderr="Could not resolve to a Blob", returncode=1)
 
-            # The implementation catches NotFoundError and returns None
-            content = await gh.get_file_content("owner/repo", "nonexistent.py")
+        # The implementation catches NotFoundError and returns None
+        content = await stub_gh.get_file_content("owner/repo", "nonexistent.py")
 
-            assert content is None
+        assert content is None
 
 
 class TestSafeGHCliGetDefaultBranch:
     """Test get_default_branch method."""
 
-    @pytest.fixture
-    def gh(self) -> SafeGHCli:
-        """Create a SafeGHCli instance with mocked gh path."""
-        with patch("shutil.which", return_value="/usr/bin/gh"):
-            return SafeGHCli()
-
-    async def test_get_default_branch_returns_main(self, gh: SafeGHCli) -> None:
-        """Test getting default branch when it's main."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            # --jq extracts just the branch name directly
-            mock_proc.stdout = "main\n"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
-
-            branch = await gh.get_default_branch("owner/repo")
-
-            assert branch == "main"
-
-    async def test_get_default_branch_returns_master(self, gh: SafeGHCli) -> None:
-        """Test getting default branch when it's master."""
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_proc = MagicMock()
-            # --jq extracts just the branch name directly
-            mock_proc.stdout = "master\n"
-            mock_proc.stderr = ""
-            mock_proc.returncode = 0
-            mock_thread.return_value = mock_proc
-
-            branch = await gh.get_default_branch("owner/repo")
+    @pytest.mark.parametrize("branch", ["main", "master"])
+    async def test_get_default_branch(
+        self, stub_gh: SafeGHCli, runner: _RecordingRunner, branch: str
+    ) -> None:
+        """Test getting the default branch name."""
+        # --jq extracts just the branch name directly
+        runner.result = _proc(stdout=f"{branch}\n")
 
-            assert branch == "master"
+        assert await stub_gh.get_default_branch("owner/repo") == branch
 
     async def test_get_default_branch_validates_repo(self, gh: SafeGHCli) -> None:
         """Test that get_default_branch validates repository name."""
-        with pytest.raises(SecurityError, match="Invalid repository name"):
+        with pytest.raises(SecurityError, match=_INVALID_REPO):
             await gh.get_default_branch("invalid$(whoami)")
@@ -1,7 +1,10 @@
 """Tests for traceback data models."""
 
+from unittest.mock import patch
+
 import pytest
 
+from ai_issue_agent.models import traceback as traceback_models
 from ai_issue_agent.models.traceback import ParsedTraceback, StackFrame
 
 
@@ -42,8 +45,8 @@ class TestStackFrame:
             StackFrame("<built-in>", 1, "foo"),
         ]
 
-        for frame in frames:
-            assert frame.is_stdlib, f"Expected {frame.file_path} to be stdlib"
+        # One assertion that still names every misclassified path
+        assert [frame.file_path for frame in frames if not frame.is_stdlib] == []
 
     def test_is_stdlib_false_for_project_code(self) -> None:
         """Test is_stdlib returns False for project code."""
@@ -62,19 +65,26 @@ class TestStackFrame:
             StackFrame("/usr/lib/python3.11/dist-packages/pkg/mod.py", 1, "foo"),
         ]
 
-        for frame in frames:
-            assert frame.is_site_packages, f"Expected {frame.file_path} to be site-packages"
+        assert [frame.file_path for frame in frames if not frame.is_site_packages] == []
 
     def test_is_site_packages_false_for_project_code(self) -> None:
         """Test is_site_packages returns False for project code."""
         frame = StackFrame("/app/src/main.py", 1, "foo")
         assert not frame.is_site_packages
 
+    def test_site_packages_under_python_lib_is_both(self) -> None:
+        """Test that the stdlib and site-packages checks are independent."""
+        frame = StackFrame("/usr/lib/python3.11/site-packages/requests/api.py", 1, "get")
+
+        assert frame.is_stdlib
+        assert frame.is_site_packages
+
     def test_normalized_path_strips_prefixes(self) -> None:
         """Test normalized_path removes common absolute prefixes."""
         test_cases = [
             ("/usr/local/app/src/main.py", "app/src/main.py"),
             ("/home/user/project/src/app.py", "project/src/app.py"),
+            ("/home/user/project/src/app/main.py", "src/app/main.py"),
             ("/Users/alice/work/myapp/core.py", "work/myapp/core.py"),
             ("C:\\projects\\app\\main.py", "projects/app/main.py"),
             ("relative/path/file.py", "relative/path/file.py"),
@@ -93,6 +103,32 @@ class TestStackFrame:
         with pytest.raises(AttributeError):
             frame.line_number = 99  # type: ignore
 
+    def test_normalized_path_computed_once(self) -> None:
+        """Test that normalized_path is computed on first access and then reused."""
+        frame = StackFrame("/home/user/project/src/app/main.py", 1, "foo")
+
+        with patch.object(
+            traceback_models, "_normalize_path", wraps=traceback_models._normalize_path
+        ) as normalize:
+            assert frame.normalized_path == "src/app/main.py"
+            assert frame.normalized_path == "src/app/main.py"
+
+        assert normalize.call_count == 1
+
+    def test_uses_slots(self) -> None:
+        """Test that StackFrame stores fields in slots, not a __dict__."""
+        frame = StackFrame("/app/main.py", 1, "foo")
+
+        assert not hasattr(frame, "__dict__")
+
+    def test_equality_and_hash_cover_all_fields(self) -> None:
+        """Test that frames compare and hash by every field, including code_line."""
+        frame = StackFrame("/app/main.py", 1, "foo", "run()")
+
+        assert frame == StackFrame("/app/main.py", 1, "foo", "run()")
+        assert hash(frame) == hash(StackFrame("/app/main.py", 1, "foo", "run()"))
+        assert frame != StackFrame("/app/main.py", 1, "foo", "stop()")
+
 
 class TestParsedTraceback:
     """Test ParsedTraceback dataclass."""
@@ -172,6 +208,35 @@ class TestParsedTraceback:
         with pytest.raises(ValueError, match="Traceback has no frames"):
             _ = tb.innermost_frame
 
+    def test_innermost_project_frame_skips_library_frames(self) -> None:
+        """Test innermost_project_frame returns the deepest project frame."""
+        frames = (
+            StackFrame("/app/main.py", 10, "main"),
+            StackFrame("/app/db.py", 50, "query"),
+            StackFrame("/usr/lib/python3.11/site-packages/sqlalchemy/engine.py", 40, "execute"),
+            StackFrame("/usr/lib/python3.11/asyncio/events.py", 20, "run"),
+        )
+
+        tb = ParsedTraceback(
+            exception_type="ValueError",
+            exception_message="test",
+            frames=frames,
+            raw_text="...",
+        )
+
+        assert tb.innermost_project_frame is frames[1]
+
+    def test_innermost_project_frame_none_without_project_code(self) -> None:
+        """Test innermost_project_frame is None if all frames are library code."""
+        tb = ParsedTraceback(
+            exception_type="ValueError",
+            exception_message="test",
+            frames=(StackFrame("<frozen runpy>", 198, "_run_module_as_main"),),
+            raw_text="...",
+        )
+
+        assert tb.innermost_project_frame is None
+
     def test_project_frames_filters_stdlib_and_site_packages(self) -> None:
         """Test project_frames filters out stdlib and third-party code."""
         frames = (
@@ -211,6 +276,38 @@ class TestParsedTraceback:
 
         assert len(tb.project_frames) == 0
 
+    def test_cached_properties_do_not_affect_equality(self) -> None:
+        """Test that project_frames and signature are computed once and not compared."""
+        frames = (
+            StackFrame("/app/main.py", 10, "main"),
+            StackFrame("/usr/lib/python3.11/asyncio/events.py", 20, "run"),
+        )
+        tb = ParsedTraceback("ValueError", "test", frames, "...")
+        other = ParsedTraceback("ValueError", "test", frames, "...")
+
+        assert tb.project_frames is tb.project_frames
+        assert tb.signature is tb.signature
+        assert tb == other
+        assert hash(tb) == hash(other)
+
+    def test_frames_are_classified_once_when_built(self) -> None:
+        """Test that frames classify their path on construction, not on access."""
+        with patch.object(
+            traceback_models, "_classify_path", wraps=traceback_models._classify_path
+        ) as classify:
+            frames = (
+                StackFrame("/app/main.py", 10, "main"),
+                StackFrame("/usr/lib/python3.11/asyncio/events.py", 20, "run"),
+                StackFrame("/app/db.py", 50, "query"),
+            )
+            tb = ParsedTraceback("ValueError", "test", frames, "...")
+            for _ in range(3):
+                assert tb.project_frames == (frames[0], frames[2])
+                assert tb.innermost_project_frame is frames[2]
+                assert [frame.is_stdlib for frame in frames] == [False, True, False]
+
+        assert classify.call_count == len(frames)
+
     def test_signature_format(self) -> None:
         """Test signature property format for deduplication."""
         tb = ParsedTraceback(
@@ -244,3 +341,10 @@ class TestParsedTraceback:
 
         with pytest.raises(AttributeError):
             tb.exception_type = "TypeError"  # type: ignore
+
+    def test_uses_slots(self) -> None:
+        """Test that ParsedTraceback stores fields and caches in slots, not a __dict__."""
+        tb = ParsedTraceback("ValueError", "test", (StackFrame("/app/main.py", 1, "foo"),), "...")
+
+        assert tb.project_frames == tb.frames
+        assert not hasattr(tb, "__dict__")
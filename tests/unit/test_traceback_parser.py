@@ -1,18 +1,39 @@
 """Tests for TracebackParser functionality."""
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib.util import find_spec
+from itertools import islice
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
 import pytest
 
-from ai_issue_agent.core.traceback_parser import TracebackParser
+from ai_issue_agent.core import traceback_parser
+from ai_issue_agent.core.traceback_parser import (
+    TracebackParser,
+    _split_frame_line,
+    contains_traceback,
+    extract_tracebacks,
+    parse_traceback,
+)
+from ai_issue_agent.models.traceback import ParsedTraceback, StackFrame
 from ai_issue_agent.utils.async_helpers import TracebackParseError
 
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+_HAS_BENCHMARK = find_spec("pytest_benchmark") is not None
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> TracebackParser:
-    """Create a TracebackParser instance."""
+    """Create a TracebackParser instance shared by the module (it is stateless)."""
     return TracebackParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_traceback() -> str:
     """Return a simple traceback."""
     return """Traceback (most recent call last):
@@ -26,7 +47,13 @@ ValueError: Invalid value
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def parsed_simple(parser: TracebackParser, simple_traceback: str) -> ParsedTraceback:
+    """Return simple_traceback parsed once for the tests that only read it."""
+    return parser.parse(simple_traceback)
+
+
+@pytest.fixture(scope="module")
 def chained_traceback() -> str:
     """Return a chained exception traceback."""
     return """Traceback (most recent call last):
@@ -47,7 +74,7 @@ DataLoadError: Failed to load data
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def syntax_error_traceback() -> str:
     """Return a syntax error traceback."""
     return """  File "/home/user/project/src/app/broken.py", line 5
@@ -57,7 +84,7 @@ SyntaxError: unexpected EOF while parsing
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def traceback_in_code_block() -> str:
     """Return a traceback inside a code block."""
     return """Here's the error I'm getting:
@@ -76,61 +103,99 @@ Can you help?
 class TestTracebackParserContains:
     """Tests for contains_traceback method."""
 
-    def test_contains_simple_traceback(
+    @pytest.mark.parametrize(
+        "fixture_name",
+        [
+            "simple_traceback",
+            "chained_traceback",
+            "syntax_error_traceback",
+            "traceback_in_code_block",
+        ],
+    )
+    def test_contains_traceback(
         self,
         parser: TracebackParser,
-        simple_traceback: str,
+        request: pytest.FixtureRequest,
+        fixture_name: str,
     ) -> None:
-        """Test detection of simple traceback."""
-        assert parser.contains_traceback(simple_traceback) is True
-
-    def test_contains_chained_traceback(
+        """Test detection of each traceback format."""
+        assert parser.contains_traceback(request.getfixturevalue(fixture_name)) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        ["This is just a normal message about fixing a bug.", ""],
+        ids=["normal_text", "empty_text"],
+    )
+    def test_no_traceback(
         self,
         parser: TracebackParser,
-        chained_traceback: str,
+        text: str,
     ) -> None:
-        """Test detection of chained exception traceback."""
-        assert parser.contains_traceback(chained_traceback) is True
+        """Test that text without a traceback returns False."""
+        assert parser.contains_traceback(text) is False
 
-    def test_contains_syntax_error(
+    def test_partial_traceback_header(
         self,
         parser: TracebackParser,
-        syntax_error_traceback: str,
     ) -> None:
-        """Test detection of syntax error traceback."""
-        assert parser.contains_traceback(syntax_error_traceback) is True
+        """Test that partial traceback patterns don't match."""
+        # Just mentioning "Traceback" shouldn't match
+        text = "I saw a Traceback error yesterday"
+        assert parser.contains_traceback(text) is False
 
-    def test_contains_code_block_traceback(
+    def test_contains_syntax_error_in_code_block(
         self,
         parser: TracebackParser,
-        traceback_in_code_block: str,
+        syntax_error_traceback: str,
     ) -> None:
-        """Test detection of traceback in code block."""
-        assert parser.contains_traceback(traceback_in_code_block) is True
-
-    def test_no_traceback_in_normal_text(
-        self,
-        parser: TracebackParser,
+        """Test detection of a syntax error inside a code block."""
+        text = f"It fails to import:\n\n```python\n{syntax_error_traceback}```\n"
+        assert parser.contains_traceback(text) is True
+
+    def test_plain_text_skips_regex(self, parser: TracebackParser) -> None:
+        """Test that text without traceback literals is rejected before any regex runs."""
+        text = "Deploy finished; see the dashboard for details. " * 100
+        with (
+            patch.object(traceback_parser, "_SYNTAX_ERROR_PATTERN") as syntax,
+            patch.object(traceback_parser, "_CODE_BLOCK_PATTERN") as code_block,
+        ):
+            assert parser.contains_traceback(text) is False
+            with pytest.raises(TracebackParseError, match="No traceback header found"):
+                parser.parse(text)
+
+        syntax.search.assert_not_called()
+        code_block.finditer.assert_not_called()
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(not _HAS_BENCHMARK, reason="pytest-benchmark is not installed")
+    def test_plain_text_benchmark(
+        self, parser: TracebackParser, benchmark: BenchmarkFixture
     ) -> None:
-        """Test that normal text returns False."""
-        text = "This is just a normal message about fixing a bug."
-        assert parser.contains_traceback(text) is False
+        """Benchmark rejecting a long chat log, which must stay on the substring fast path."""
+        text = "Deploy finished; see the dashboard for details.\n" * 2000
+        result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+            parser.contains_traceback, args=(text,), rounds=20
+        )
 
-    def test_no_traceback_empty_text(
-        self,
-        parser: TracebackParser,
-    ) -> None:
-        """Test that empty text returns False."""
-        assert parser.contains_traceback("") is False
+        assert result is False
 
-    def test_partial_traceback_header(
-        self,
-        parser: TracebackParser,
-    ) -> None:
-        """Test that partial traceback patterns don't match."""
-        # Just mentioning "Traceback" shouldn't match
-        text = "I saw a Traceback error yesterday"
-        assert parser.contains_traceback(text) is False
+    def test_short_text_result_is_cached(self, simple_traceback: str) -> None:
+        """Test that repeated checks of a short text hit the cache."""
+        cached = traceback_parser._contains_traceback_cached
+        cached.cache_clear()
+
+        assert contains_traceback(simple_traceback) is True
+        assert contains_traceback(simple_traceback) is True
+        assert cached.cache_info().hits == 1
+
+    def test_long_text_is_not_cached(self) -> None:
+        """Test that texts over the cache limit are scanned without caching."""
+        cached = traceback_parser._contains_traceback_cached
+        cached.cache_clear()
+        text = "x" * (traceback_parser._CACHED_TEXT_LIMIT + 1)
+
+        assert contains_traceback(text) is False
+        assert cached.cache_info().currsize == 0
 
 
 class TestTracebackParserParse:
@@ -138,36 +203,30 @@ class TestTracebackParserParse:
 
     def test_parse_simple_traceback(
         self,
-        parser: TracebackParser,
-        simple_traceback: str,
+        parsed_simple: ParsedTraceback,
     ) -> None:
         """Test parsing a simple traceback."""
-        result = parser.parse(simple_traceback)
-
-        assert result.exception_type == "ValueError"
-        assert result.exception_message == "Invalid value"
-        assert result.is_chained is False
-        assert result.cause is None
+        assert parsed_simple.exception_type == "ValueError"
+        assert parsed_simple.exception_message == "Invalid value"
+        assert parsed_simple.is_chained is False
+        assert parsed_simple.cause is None
 
     def test_parse_extracts_frames(
         self,
-        parser: TracebackParser,
-        simple_traceback: str,
+        parsed_simple: ParsedTraceback,
     ) -> None:
         """Test that frames are correctly extracted."""
-        result = parser.parse(simple_traceback)
-
-        assert len(result.frames) == 3
+        assert len(parsed_simple.frames) == 3
 
         # Check first frame
-        first_frame = result.frames[0]
+        first_frame = parsed_simple.frames[0]
         assert "main.py" in first_frame.file_path
         assert first_frame.line_number == 10
         assert first_frame.function_name == "main"
         assert "process_data" in (first_frame.code_line or "")
 
         # Check last frame (innermost)
-        last_frame = result.frames[-1]
+        last_frame = parsed_simple.frames[-1]
         assert "utils.py" in last_frame.file_path
         assert last_frame.line_number == 42
         assert last_frame.function_name == "parse_value"
@@ -185,6 +244,34 @@ class TestTracebackParserParse:
         assert result.exception_type == "DataLoadError"
         assert result.cause.exception_type == "ConnectionError"
 
+    def test_parse_skips_syntax_error_regex_without_syntax_errors(
+        self,
+        simple_traceback: str,
+    ) -> None:
+        """Test that the SyntaxError search only runs when its exception names appear."""
+        with patch.object(traceback_parser, "_SYNTAX_ERROR_PATTERN") as syntax:
+            result = traceback_parser._parse_traceback(simple_traceback)
+
+        assert result.exception_type == "ValueError"
+        syntax.search.assert_not_called()
+
+    def test_parse_inline_chain_marker_is_not_a_chain(
+        self,
+        parser: TracebackParser,
+        simple_traceback: str,
+    ) -> None:
+        """Test that chain marker text inside a line does not split the traceback."""
+        text = simple_traceback.replace(
+            "ValueError: Invalid value",
+            "ValueError: During handling of the above exception, another exception occurred:",
+        )
+
+        result = parser.parse(text)
+
+        assert result.is_chained is False
+        assert result.cause is None
+        assert len(result.frames) == 3
+
     def test_parse_syntax_error(
         self,
         parser: TracebackParser,
@@ -225,33 +312,67 @@ KeyboardInterrupt
         assert result.exception_type == "KeyboardInterrupt"
         assert result.exception_message == ""
 
-    def test_parse_empty_text_raises(
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("", "Empty text provided"),
+            ("Just some normal text", "No traceback header found"),
+        ],
+        ids=["empty_text", "no_traceback"],
+    )
+    def test_parse_without_traceback_raises(
         self,
         parser: TracebackParser,
+        text: str,
+        message: str,
     ) -> None:
-        """Test that empty text raises TracebackParseError."""
-        with pytest.raises(TracebackParseError) as exc_info:
-            parser.parse("")
+        """Test that text without a traceback raises TracebackParseError."""
+        with pytest.raises(TracebackParseError, match=message):
+            parser.parse(text)
 
-        assert "Empty text" in str(exc_info.value)
+    def test_parse_preserves_raw_text(
+        self,
+        parsed_simple: ParsedTraceback,
+        simple_traceback: str,
+    ) -> None:
+        """Test that raw_text is preserved."""
+        assert parsed_simple.raw_text == simple_traceback
 
-    def test_parse_no_traceback_raises(
+    def test_parse_result_is_cached(
         self,
         parser: TracebackParser,
+        simple_traceback: str,
     ) -> None:
-        """Test that text without traceback raises TracebackParseError."""
-        with pytest.raises(TracebackParseError):
-            parser.parse("Just some normal text")
+        """Test that parsing the same short text again returns the cached result."""
+        cached = traceback_parser._parse_traceback_cached
+        cached.cache_clear()
 
-    def test_parse_preserves_raw_text(
+        assert parser.parse(simple_traceback) is parser.parse(simple_traceback)
+        assert cached.cache_info().hits == 1
+
+    def test_parse_shares_raw_text_with_input(
         self,
         parser: TracebackParser,
         simple_traceback: str,
     ) -> None:
-        """Test that raw_text is preserved."""
-        result = parser.parse(simple_traceback)
+        """Test that raw_text references the input string rather than a copy."""
+        text = f"Seen in prod:\n\n{simple_traceback}"
+
+        assert parser.parse(text).raw_text is text
+
+    def test_parse_interns_repeated_strings(
+        self,
+        parser: TracebackParser,
+        simple_traceback: str,
+    ) -> None:
+        """Test that paths, function names and exception types are interned."""
+        first = parser.parse(simple_traceback)
+        second = parser.parse(simple_traceback.replace("Invalid value", "Another value"))
 
-        assert result.raw_text == simple_traceback
+        assert first.exception_type is second.exception_type
+        for a, b in zip(first.frames, second.frames, strict=True):
+            assert a.file_path is b.file_path
+            assert a.function_name is b.function_name
 
 
 class TestTracebackParserExtractAll:
@@ -282,6 +403,48 @@ class TestTracebackParserExtractAll:
         assert "ConnectionError" in exception_types
         assert "DataLoadError" in exception_types
 
+    def test_extract_all_splits_at_each_header(
+        self,
+        parser: TracebackParser,
+        chained_traceback: str,
+        simple_traceback: str,
+    ) -> None:
+        """Test that each traceback's raw text runs from its header to the next."""
+        results = parser.extract_all(f"{chained_traceback}\nLater on:\n\n{simple_traceback}")
+
+        assert [r.exception_type for r in results] == [
+            "ConnectionError",
+            "DataLoadError",
+            "ValueError",
+        ]
+        assert all(r.raw_text.startswith("Traceback (most recent call last):") for r in results)
+        assert "The above exception" not in results[0].raw_text
+        assert [len(r.frames) for r in results] == [2, 2, 3]
+
+    def test_iter_tracebacks_parses_lazily(
+        self,
+        parser: TracebackParser,
+        chained_traceback: str,
+    ) -> None:
+        """Test that iter_tracebacks parses only the tracebacks that are consumed."""
+        with patch.object(
+            traceback_parser, "_parse_single", wraps=traceback_parser._parse_single
+        ) as parse_single:
+            first = list(islice(parser.iter_tracebacks(chained_traceback), 1))
+
+        assert [tb.exception_type for tb in first] == ["ConnectionError"]
+        assert parse_single.call_count == 1
+
+    def test_module_functions_match_methods(
+        self,
+        parser: TracebackParser,
+        chained_traceback: str,
+    ) -> None:
+        """Test that the module-level functions back the parser's methods."""
+        assert contains_traceback(chained_traceback) is parser.contains_traceback(chained_traceback)
+        assert parse_traceback(chained_traceback) == parser.parse(chained_traceback)
+        assert extract_tracebacks(chained_traceback) == parser.extract_all(chained_traceback)
+
     def test_extract_all_no_tracebacks(
         self,
         parser: TracebackParser,
@@ -296,8 +459,6 @@ class TestStackFrameProperties:
 
     def test_is_stdlib_lib_path(self) -> None:
         """Test is_stdlib with library path."""
-        from ai_issue_agent.models.traceback import StackFrame
-
         frame = StackFrame(
             file_path="/usr/lib/python3.11/json/__init__.py",
             line_number=100,
@@ -307,8 +468,6 @@ class TestStackFrameProperties:
 
     def test_is_stdlib_frozen(self) -> None:
         """Test is_stdlib with frozen module."""
-        from ai_issue_agent.models.traceback import StackFrame
-
         frame = StackFrame(
             file_path="<frozen importlib._bootstrap>",
             line_number=100,
@@ -318,8 +477,6 @@ class TestStackFrameProperties:
 
     def test_is_stdlib_user_code(self) -> None:
         """Test is_stdlib with user code."""
-        from ai_issue_agent.models.traceback import StackFrame
-
         frame = StackFrame(
             file_path="/home/user/project/src/app/main.py",
             line_number=10,
@@ -329,8 +486,6 @@ class TestStackFrameProperties:
 
     def test_is_site_packages(self) -> None:
         """Test is_site_packages with installed package."""
-        from ai_issue_agent.models.traceback import StackFrame
-
         frame = StackFrame(
             file_path="/home/user/.venv/lib/python3.11/site-packages/requests/api.py",
             line_number=50,
@@ -340,8 +495,6 @@ class TestStackFrameProperties:
 
     def test_is_not_site_packages(self) -> None:
         """Test is_site_packages with user code."""
-        from ai_issue_agent.models.traceback import StackFrame
-
         frame = StackFrame(
             file_path="/home/user/project/src/app/main.py",
             line_number=10,
@@ -355,20 +508,15 @@ class TestParsedTracebackProperties:
 
     def test_innermost_frame(
         self,
-        parser: TracebackParser,
-        simple_traceback: str,
+        parsed_simple: ParsedTraceback,
     ) -> None:
         """Test innermost_frame property."""
-        result = parser.parse(simple_traceback)
-
-        innermost = result.innermost_frame
+        innermost = parsed_simple.innermost_frame
         assert "utils.py" in innermost.file_path
         assert innermost.line_number == 42
 
     def test_innermost_frame_no_frames_raises(self) -> None:
         """Test innermost_frame raises when no frames."""
-        from ai_issue_agent.models.traceback import ParsedTraceback
-
         tb = ParsedTraceback(
             exception_type="ValueError",
             exception_message="test",
@@ -402,18 +550,66 @@ ValueError: Invalid JSON
 
     def test_signature(
         self,
-        parser: TracebackParser,
-        simple_traceback: str,
+        parsed_simple: ParsedTraceback,
     ) -> None:
         """Test signature property."""
-        result = parser.parse(simple_traceback)
-
-        assert result.signature == "ValueError: Invalid value"
+        assert parsed_simple.signature == "ValueError: Invalid value"
 
 
 class TestEdgeCases:
     """Tests for edge cases and special formats."""
 
+    def test_standard_frames_use_fast_path(self, simple_traceback: str) -> None:
+        """Test that standard frame layout is read without splitting lines."""
+        with patch.object(traceback_parser, "_split_frame_line") as split:
+            frames = traceback_parser._extract_frames(simple_traceback)
+
+        split.assert_not_called()
+        assert [(f.line_number, f.function_name) for f in frames] == [
+            (10, "main"),
+            (25, "process_data"),
+            (42, "parse_value"),
+        ]
+        assert frames[0].code_line == "result = process_data(data)"
+
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            pytest.param(lambda text: text.replace("\n", "\r\n"), id="crlf"),
+            pytest.param(lambda text: text.replace("  File", "    File"), id="indented"),
+            pytest.param(
+                lambda text: text.replace("ValueError: Invalid", 'ValueError: File "x" is'),
+                id="file_in_message",
+            ),
+        ],
+    )
+    def test_nonstandard_frames_match_fast_path(
+        self,
+        simple_traceback: str,
+        variant: Callable[[str], str],
+    ) -> None:
+        """Test that layouts the fast path rejects yield the same frames."""
+        expected = traceback_parser._extract_frames(simple_traceback)
+        frames = traceback_parser._extract_frames(variant(simple_traceback))
+
+        assert frames == expected
+
+    def test_frames_without_code_lines(
+        self,
+        parser: TracebackParser,
+    ) -> None:
+        """Test that code lines attach only to the frame directly above them."""
+        traceback_text = """Traceback (most recent call last):
+  File "<frozen runpy>", line 198, in _run_module_as_main
+  File "/app/main.py", line 3, in <module>
+    main()
+  File "<stdin>", line 1
+KeyError: 'x'
+"""
+        result = parser.parse(traceback_text)
+
+        assert [frame.code_line for frame in result.frames] == [None, "main()", None]
+
     def test_multiline_exception_message(
         self,
         parser: TracebackParser,
@@ -503,3 +699,28 @@ IndentationError: expected an indented block
         result = parser.parse(traceback_text)
 
         assert result.exception_type == "TabError"
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            '  File "/app/main.py", line 10, in main',
+            '  File "/app/main.py", line 10',
+            'File "/app/main.py", line 10, in <lambda>',
+            '\tFile "/app/main.py", line 10, in f, in g',
+            '  File "/app/main.py", line 10, in ',
+            '  File "/app/main.py", line 10x, in main',
+            '  File "/app/main.py", line ²',
+            '  File "", line 10, in main',
+            '  File "a"b", line 10, in main',
+            '  File "/app/main.py" line 10, in main',
+            "    result = process_data(data)",
+            'ValueError: File "x", line 1',
+            "",
+        ],
+    )
+    def test_frame_line_split_matches_frame_pattern(self, line: str) -> None:
+        """Test that the str-based frame splitter agrees with FRAME_PATTERN."""
+        match = TracebackParser.FRAME_PATTERN.match(line)
+        expected = (match[1], int(match[2]), match[3] or "<module>") if match else None
+
+        assert _split_frame_line(line) == expected